@@ -0,0 +1,35 @@
+"""
+Ahead-of-time build of the GEX kernel.
+
+Compiles _gex_kernels.gex_kernel with numba.pycc into the _gex_kernels_aot
+extension module next to this file, so the server's first calculate() does
+not pay Numba's JIT compile or cache-load cost. gex_engine imports the AOT
+module when present and falls back to the JIT kernel otherwise.
+
+Requires numba and a C compiler at build time only:
+    python _build_gex_kernels.py
+
+The AOT build is serial (pycc does not support parallel=True); at 0DTE
+chain sizes the loop is dominated by call overhead rather than throughput.
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from _gex_kernels import gex_kernel
+
+# (strike, oi, gamma, vega, iv, direction, strike_idx, n_strikes, spot, tau)
+GEX_KERNEL_SIGNATURE = (
+    "Tuple((f8, f8, f8, f8, f8, f8[:]))"
+    "(f8[:], f8[:], f8[:], f8[:], f8[:], i1[:], i8[:], i8, f8, f8)"
+)
+
+cc = CC("_gex_kernels_aot")
+cc.output_dir = str(Path(__file__).parent)
+cc.verbose = True
+cc.export("gex_kernel", GEX_KERNEL_SIGNATURE)(gex_kernel.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
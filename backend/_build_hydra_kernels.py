@@ -0,0 +1,31 @@
+"""
+Ahead-of-time build of the HYDRA engine kernels.
+
+Compiles the _hydra_kernels functions with numba.pycc into the
+_hydra_kernels_aot extension module next to this file, so a freshly started
+orchestrator does not pay Numba's JIT compile or cache-load cost before its
+first cycle, and small per-tick calls skip the dispatcher. hydra_engine
+imports the AOT module when present and falls back to the JIT kernels
+otherwise.
+
+Requires numba and a C compiler at build time only:
+    python _build_hydra_kernels.py
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from _hydra_kernels import autocorr_mr, trend_mr, rolling_std, window_mean_m2
+
+cc = CC("_hydra_kernels_aot")
+cc.output_dir = str(Path(__file__).parent)
+cc.verbose = True
+cc.export("autocorr_mr", "float64(float64[::1])")(autocorr_mr.py_func)
+cc.export("trend_mr", "UniTuple(float64, 2)(float64[::1])")(trend_mr.py_func)
+cc.export("rolling_std", "float64(float64[::1])")(rolling_std.py_func)
+cc.export("window_mean_m2", "UniTuple(float64, 2)(float64[::1])")(window_mean_m2.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
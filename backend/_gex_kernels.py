@@ -0,0 +1,68 @@
+"""
+HYDRA GEX compute kernels.
+
+Fused per-option GEX/charm/vanna kernel for gex_engine, JIT-compiled with
+Numba when it is installed. Without Numba the decorators are no-ops so the
+module still imports; gex_engine then uses its NumPy path instead.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+# fastmath minus "nnan": missing IV arrives as NaN and must fail the sigma > 0 test
+@njit(cache=True, fastmath={"reassoc", "contract", "arcp", "nsz", "afn"}, parallel=True)
+def gex_kernel(strike, oi, gamma, vega, iv, direction, strike_idx, n_strikes, spot, tau):
+    """
+    Single pass over pre-filtered options (strike > 0, OI > 0).
+    direction is int8 +1 for calls, -1 for puts.
+
+    Returns (total_gex, call_gex, put_gex, total_charm, total_vanna, per_strike_gex)
+    where per_strike_gex[k] sums GEX for options with strike_idx == k.
+    """
+    n = strike.shape[0]
+    gex = np.zeros(n)
+    spot_sq = spot * spot
+    sqrt_tau = math.sqrt(tau) if tau > 0 else 0.0
+
+    total_gex = 0.0
+    call_gex = 0.0
+    total_charm = 0.0
+    total_vanna = 0.0
+
+    for i in prange(n):
+        sign = float(direction[i])
+        g = 0.0
+        if gamma[i] > 0:
+            g = gamma[i] * oi[i] * 100.0 * spot_sq * sign
+        gex[i] = g
+        total_gex += g
+        call_gex += g if sign > 0 else 0.0
+
+        sigma = iv[i]
+        if tau > 0 and sigma > 0:
+            d1 = (math.log(spot / strike[i]) + (0.05 + sigma * sigma * 0.5) * tau) / (sigma * sqrt_tau)
+            weight = oi[i] * 100.0 * sign
+            total_charm += -gamma[i] * (0.05 - d1 * sigma / (2 * tau)) * weight
+            if vega[i] != 0:
+                total_vanna += vega[i] * d1 / (spot * sigma * sqrt_tau) * weight
+
+    # Serial so concurrent iterations never write the same bucket
+    per_strike = np.zeros(n_strikes)
+    for i in range(n):
+        per_strike[strike_idx[i]] += gex[i]
+
+    return total_gex, call_gex, total_gex - call_gex, total_charm, total_vanna, per_strike
@@ -0,0 +1,123 @@
+"""
+HYDRA regime/strategy compute kernels.
+
+Scalar loops over float64 windows used by hydra_engine's RegimeDetector and
+MetalsFlowTrader, JIT-compiled with Numba (signatures declared, so they
+compile or load from cache at import) when it is installed. Without Numba the
+decorators are no-ops and the kernels run as plain Python, which also accepts
+lists, so hydra_engine keeps working without NumPy.
+"""
+
+import math
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+@njit("float64(float64[::1])", cache=True, fastmath=True, nogil=True)
+def autocorr_mr(prices) -> float:
+    """
+    Mean-reversion score from the lag-1 autocorrelation of simple returns over
+    `prices` (pass the last 31 prices). Returns are recomputed on the fly with a
+    rolling previous value, so no temporary lists or arrays are built.
+    Returns 0 (trending) to 1 (strongly mean-reverting); 0.5 when undetermined.
+    """
+    n = 0
+    sum_r = 0.0
+    for i in range(1, len(prices)):
+        if prices[i - 1] != 0:
+            sum_r += (prices[i] - prices[i - 1]) / prices[i - 1]
+            n += 1
+
+    if n < 10:
+        return 0.5
+    mean_r = sum_r / n
+
+    var = 0.0
+    cov = 0.0
+    prev = 0.0
+    first = True
+    for i in range(1, len(prices)):
+        if prices[i - 1] != 0:
+            d = (prices[i] - prices[i - 1]) / prices[i - 1] - mean_r
+            var += d * d
+            if not first:
+                cov += d * prev
+            prev = d
+            first = False
+
+    if var == 0:
+        return 0.5
+
+    # Negative autocorrelation = mean reverting
+    # Map from [-1, 1] to [0, 1] where 1 = strongly mean-reverting
+    return min(1.0, max(0.0, 0.5 - cov / var))
+
+
+@njit("UniTuple(float64, 2)(float64[::1])", cache=True, fastmath=True, nogil=True)
+def trend_mr(prices):
+    """
+    Fused trend + mean-reversion pass over the detector's price tail (the last
+    50 prices, oldest first). Returns (trend, mr_score) with the same semantics
+    as RegimeDetector._calc_trend_strength and _calc_mean_reversion.
+    """
+    n = len(prices)
+
+    trend = 0.0
+    if n >= 50:
+        last = prices[n - 1]
+        raw = 0.0
+        p5 = prices[n - 5]
+        if p5 != 0:
+            raw += (last - p5) / p5 * 0.5
+        p20 = prices[n - 20]
+        if p20 != 0:
+            raw += (last - p20) / p20 * 0.3
+        p50 = prices[n - 50]
+        if p50 != 0:
+            raw += (last - p50) / p50 * 0.2
+        trend = max(-1.0, min(1.0, raw * 100 / 5.0))
+
+    mr_score = 0.5
+    if n >= 30:
+        mr_score = autocorr_mr(prices[max(0, n - 31):])
+
+    return trend, mr_score
+
+
+@njit("float64(float64[::1])", cache=True, fastmath=True, nogil=True)
+def rolling_std(x) -> float:
+    """Sample standard deviation of x in one pass (Welford); 0 for fewer than 2 values."""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for v in x:
+        n += 1
+        d = v - mean
+        mean += d / n
+        m2 += d * (v - mean)
+    if n < 2:
+        return 0.0
+    return math.sqrt(m2 / (n - 1))
+
+
+@njit("UniTuple(float64, 2)(float64[::1])", cache=True, fastmath=True, nogil=True)
+def window_mean_m2(x):
+    """(mean, sum of squared deviations) of x, two-pass for accuracy."""
+    n = len(x)
+    total = 0.0
+    for v in x:
+        total += v
+    mean = total / n
+    m2 = 0.0
+    for v in x:
+        m2 += (v - mean) * (v - mean)
+    return mean, m2
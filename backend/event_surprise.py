@@ -11,13 +11,16 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import functools
 import os
 import json
 import logging
 import sqlite3
+from collections import OrderedDict
+from contextvars import ContextVar
 from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass, asdict, field
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 
 log = logging.getLogger("HYDRA.EVENTS")
@@ -31,12 +34,21 @@ except ImportError:
 DATA_DIR = Path(__file__).parent.parent / "data"
 EVENTS_DB = DATA_DIR / "event_surprises.db"
 
+# Number of minute buckets of API output to keep cached
+API_CACHE_BUCKETS = 4
+
+# Task-local consensus overrides ({event_name: consensus}) for what-if runs
+# and tests; lets concurrent release checks diverge without sharing state.
+_current_consensus_override: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "_consensus_override", default=None
+)
+
 
 # ═══════════════════════════════════════════════════════════════
 #  EVENT DEFINITIONS
 # ═══════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class EconomicEvent:
     """Definition of a scheduled economic event."""
     name: str
@@ -48,10 +60,23 @@ class EconomicEvent:
     unit: str                    # %, K, M, etc.
     importance: str              # HIGH, MEDIUM, LOW
     category: str                # inflation, labor, growth, rates
-    assets_affected: List[str]
+    assets_affected: Tuple[str, ...]
+    _dt: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen so the same sequence can be shared across API responses
+        self.assets_affected = tuple(self.assets_affected)
+        # Parse the release time once instead of on every calendar query
+        try:
+            self._dt = datetime.strptime(
+                f"{self.date} {self.time}",
+                "%Y-%m-%d %H:%M"
+            ).replace(tzinfo=timezone.utc)
+        except ValueError:
+            self._dt = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EventSurprise:
     """Result of surprise detection after data release."""
     event_name: str
@@ -64,11 +89,27 @@ class EventSurprise:
     direction: str              # BETTER_THAN_EXPECTED, WORSE_THAN_EXPECTED, IN_LINE
     magnitude: str              # MASSIVE, LARGE, MODERATE, SMALL
     market_impact: str          # Description of expected impact
-    trade_signals: List[str]    # Suggested trades
+    trade_signals: Tuple[str, ...]  # Suggested trades
     confidence: float           # Data quality confidence
 
+    def __post_init__(self):
+        self.trade_signals = tuple(self.trade_signals)
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "event_name": self.event_name,
+            "timestamp": self.timestamp,
+            "actual": self.actual,
+            "consensus": self.consensus,
+            "previous": self.previous,
+            "surprise_pct": self.surprise_pct,
+            "surprise_std": self.surprise_std,
+            "direction": self.direction,
+            "magnitude": self.magnitude,
+            "market_impact": self.market_impact,
+            "trade_signals": list(self.trade_signals),
+            "confidence": self.confidence,
+        }
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -182,6 +223,7 @@ class EventCalendar:
     ]
 
     def __init__(self):
+        self._api_cache: "OrderedDict[tuple, List[dict]]" = OrderedDict()
         self._init_db()
 
     def _init_db(self):
@@ -213,58 +255,51 @@ class EventCalendar:
         except Exception as e:
             log.error(f"Event DB init error: {e}")
 
-    def get_upcoming_events(self, hours: int = 24) -> List[EconomicEvent]:
+    def get_upcoming_events(self, hours: int = 24, now: Optional[datetime] = None) -> List[EconomicEvent]:
         """Get events happening within the next N hours."""
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         cutoff = now + timedelta(hours=hours)
 
-        upcoming = []
-        for event in self.EVENTS:
-            try:
-                event_dt = datetime.strptime(
-                    f"{event.date} {event.time}",
-                    "%Y-%m-%d %H:%M"
-                ).replace(tzinfo=timezone.utc)
-
-                if now <= event_dt <= cutoff:
-                    upcoming.append(event)
-            except ValueError:
-                continue
-
-        return sorted(upcoming, key=lambda e: f"{e.date} {e.time}")
+        upcoming = [
+            event for event in self.EVENTS
+            if event._dt is not None and now <= event._dt <= cutoff
+        ]
+        return sorted(upcoming, key=lambda e: e._dt)
 
     def get_events_for_api(self, hours: int = 72) -> List[dict]:
-        """Get events formatted for API response."""
-        events = self.get_upcoming_events(hours)
+        """Get events formatted for API response (cached per minute)."""
         now = datetime.now(timezone.utc)
+        key = (hours, int(now.timestamp() // 60))
+
+        cached = self._api_cache.get(key)
+        if cached is None:
+            cached = self._build_events_for_api(hours, now)
+            self._api_cache[key] = cached
+            while len(self._api_cache) > API_CACHE_BUCKETS:
+                self._api_cache.popitem(last=False)
+
+        return list(cached)
 
+    def _build_events_for_api(self, hours: int, now: datetime) -> List[dict]:
+        """Format upcoming events for the API response."""
         result = []
-        for event in events:
-            try:
-                event_dt = datetime.strptime(
-                    f"{event.date} {event.time}",
-                    "%Y-%m-%d %H:%M"
-                ).replace(tzinfo=timezone.utc)
-
-                time_until = (event_dt - now).total_seconds()
-                minutes_until = int(time_until / 60)
-                hours_until = time_until / 3600
-
-                result.append({
-                    "name": event.name,
-                    "datetime": event_dt.isoformat(),
-                    "minutes_until": minutes_until,
-                    "hours_until": round(hours_until, 1),
-                    "consensus": event.consensus,
-                    "previous": event.previous,
-                    "unit": event.unit,
-                    "importance": event.importance,
-                    "category": event.category,
-                    "assets_affected": event.assets_affected,
-                    "impact_description": self._get_impact_description(event)
-                })
-            except ValueError:
-                continue
+        for event in self.get_upcoming_events(hours, now):
+            time_until = (event._dt - now).total_seconds()
+
+            result.append({
+                "name": event.name,
+                "datetime": event._dt.isoformat(),
+                "minutes_until": int(time_until / 60),
+                "hours_until": round(time_until / 3600, 1),
+                "consensus": event.consensus,
+                "previous": event.previous,
+                "unit": event.unit,
+                "importance": event.importance,
+                "category": event.category,
+                "assets_affected": event.assets_affected,
+                "impact_description": self._get_impact_description(event)
+            })
 
         return result
 
@@ -317,12 +352,17 @@ class SurpriseDetector:
         if not event.fred_series or not self.fred_api_key:
             return None
 
+        now = datetime.now(timezone.utc)
         try:
             actual = self._fetch_fred_data(event.fred_series)
             if actual is None:
                 return None
 
-            consensus = event.consensus or 0
+            overrides = _current_consensus_override.get()
+            if overrides and event.name in overrides:
+                consensus = overrides[event.name]
+            else:
+                consensus = event.consensus or 0
             previous = event.previous or 0
 
             # Calculate surprise
@@ -349,7 +389,7 @@ class SurpriseDetector:
 
             return EventSurprise(
                 event_name=event.name,
-                timestamp=datetime.now(timezone.utc).isoformat(),
+                timestamp=now.isoformat(),
                 actual=actual,
                 consensus=consensus,
                 previous=previous,
@@ -497,8 +537,11 @@ class SurpriseDetector:
 
         return trades
 
-    def save_result(self, surprise: EventSurprise, spy_move_15: float = None, spy_move_30: float = None):
+    def save_result(self, surprise: EventSurprise, spy_move_15: float = None, spy_move_30: float = None,
+                    now: Optional[datetime] = None):
         """Save surprise result to database for future calibration."""
+        if now is None:
+            now = datetime.fromisoformat(surprise.timestamp)
         try:
             conn = sqlite3.connect(str(EVENTS_DB))
             cursor = conn.cursor()
@@ -509,7 +552,7 @@ class SurpriseDetector:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 surprise.event_name,
-                datetime.now().strftime("%Y-%m-%d"),
+                now.strftime("%Y-%m-%d"),
                 surprise.actual,
                 surprise.consensus,
                 surprise.previous,
@@ -530,22 +573,15 @@ class SurpriseDetector:
 #  SINGLETON INSTANCES
 # ═══════════════════════════════════════════════════════════════
 
-_calendar_instance: Optional[EventCalendar] = None
-_detector_instance: Optional[SurpriseDetector] = None
-
+@functools.cache
 def get_event_calendar() -> EventCalendar:
     """Get or create singleton EventCalendar."""
-    global _calendar_instance
-    if _calendar_instance is None:
-        _calendar_instance = EventCalendar()
-    return _calendar_instance
+    return EventCalendar()
 
+@functools.cache
 def get_surprise_detector() -> SurpriseDetector:
     """Get or create singleton SurpriseDetector."""
-    global _detector_instance
-    if _detector_instance is None:
-        _detector_instance = SurpriseDetector()
-    return _detector_instance
+    return SurpriseDetector()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -13,12 +13,20 @@ Classifies:
 Cost: ~$30/year with prompt caching
 """
 
+import asyncio
+import atexit
+import bisect
 import os
 import json
 import logging
+import math
+import re
 import sqlite3
-from datetime import datetime, timezone, time
-from dataclasses import dataclass, asdict
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict
 from pathlib import Path
 
@@ -26,10 +34,36 @@ log = logging.getLogger("HYDRA.FLOWDECODER")
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 from bedrock_client import get_bedrock_client, BedrockResponse
 
 # Data directory
@@ -39,10 +73,120 @@ FLOW_DB = DATA_DIR / "flow_history.db"
 # Flow thresholds
 MIN_PREMIUM_SWEEP = 50000      # $50K minimum for sweep consideration
 MIN_CONTRACTS_BLOCK = 100      # 100+ contracts = institutional
-SWEEP_CONDITIONS = [12, 37]    # Trade condition codes for sweeps
-
-
-@dataclass
+SWEEP_CONDITIONS = frozenset(("I", "K", "M"))  # Alpaca intermarket sweep condition codes
+TRADE_LABELS = ("PUT", "PUT_SWEEP", "CALL", "CALL_SWEEP")  # indexed by (is_call << 1) | is_sweep
+# OCC option symbol: underlying, YYMMDD expiry, C/P, strike * 1000 (Polygon adds "O:")
+OPTION_SYMBOL_RE = re.compile(r"^(?:O:)?([A-Z]+)(\d{6})([CP])(\d{8})$")
+
+# Institutional bias -> (direction sign, conviction magnitude)
+BIAS_TABLE: Dict[str, tuple] = {
+    "AGGRESSIVELY_BULLISH": (1, 10),
+    "MODERATELY_BULLISH": (1, 5),
+    "MODERATELY_BEARISH": (-1, 5),
+    "AGGRESSIVELY_BEARISH": (-1, 10),
+}
+DIRECTION_SIGN: Dict[str, int] = {"BULLISH": 1, "BEARISH": -1}
+
+# Rule-based call/put ratio bins. Bearish edges are strict (< 0.4, < 0.67) so
+# they sit one float below the threshold; bullish edges (> 1.5, > 2.5) are exact.
+RATIO_EDGES = (math.nextafter(0.4, 0), math.nextafter(0.67, 0), 1.5, 2.5)
+BIAS_AT_BIN = (
+    "AGGRESSIVELY_BEARISH", "MODERATELY_BEARISH", "NEUTRAL",
+    "MODERATELY_BULLISH", "AGGRESSIVELY_BULLISH",
+)
+CONFIDENCE_AT_BIN = (None, 70, 60, 70, None)   # None = scaled by ratio
+
+# Skip Haiku when the rule-based answer is already decisive
+HAIKU_MIN_TOTAL_PREMIUM = 250_000
+HAIKU_RATIO_BAND = (0.33, 3.0)   # only call/put ratios inside this band go to Haiku
+
+# Local cache of Haiku classifications for near-identical flow
+HAIKU_CACHE_SIZE = 64
+HAIKU_CACHE_TTL_SECONDS = 300
+
+# History write buffer: flush after this many rows or seconds
+HISTORY_FLUSH_ROWS = 8
+HISTORY_FLUSH_SECONDS = 600
+
+# Outermost {...} span in a model reply (Haiku sometimes wraps JSON in prose)
+_JSON_OBJECT_RE = re.compile(rb"\{.*\}", re.DOTALL)
+
+# Hoisted so sqlite3's statement cache always sees the identical string
+_INSERT_SQL = (
+    "INSERT INTO flow_history "
+    "(timestamp, ticker, net_premium_calls, net_premium_puts, institutional_bias, confidence, haiku_analysis) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _dumps(obj) -> str:
+    """Compact JSON encoding, via orjson when installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _parse_json_object(text: str) -> Optional[dict]:
+    """Extract the JSON object from a model reply, tolerating surrounding prose."""
+    match = _JSON_OBJECT_RE.search(text.encode())
+    if not match:
+        return None
+    try:
+        result = orjson.loads(match.group(0)) if HAS_ORJSON else json.loads(match.group(0))
+    except ValueError:
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def _flow_reduce_numpy(premium, counted, calls, puts, sweeps) -> tuple:
+    """Premium sums, sweep counts and largest-trade index via NumPy reductions."""
+    call_mask = counted & calls
+    put_mask = counted & puts
+    largest = int(np.argmax(np.where(counted, premium, -1.0))) if counted.any() else -1
+    return (
+        float(premium[call_mask].sum()),
+        float(premium[put_mask].sum()),
+        int(np.count_nonzero(call_mask & sweeps)),
+        int(np.count_nonzero(put_mask & sweeps)),
+        largest,
+    )
+
+
+def _flow_reduce_loop(premium, counted, calls, puts, sweeps):
+    """Single-pass flow reduction; compiled with Numba when available."""
+    call_premium = 0.0
+    put_premium = 0.0
+    call_sweeps = 0
+    put_sweeps = 0
+    largest = -1
+    largest_premium = 0.0
+
+    for i in range(premium.shape[0]):
+        if not counted[i]:
+            continue
+        p = premium[i]
+        if calls[i]:
+            call_premium += p
+            if sweeps[i]:
+                call_sweeps += 1
+        elif puts[i]:
+            put_premium += p
+            if sweeps[i]:
+                put_sweeps += 1
+        if p > largest_premium:
+            largest_premium = p
+            largest = i
+
+    return call_premium, put_premium, call_sweeps, put_sweeps, largest
+
+
+if HAS_NUMBA:
+    _flow_reduce = njit(cache=True)(_flow_reduce_loop)
+else:
+    _flow_reduce = _flow_reduce_numpy
+
+
+@dataclass(slots=True)
 class FlowSnapshot:
     """Complete flow intelligence at a point in time."""
     timestamp: str
@@ -58,9 +202,31 @@ class FlowSnapshot:
     total_trades_analyzed: int
     haiku_analysis: str
     latency_ms: float
+    _json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_json(self) -> bytes:
+        """Serialized to_dict(), encoded once and reused for every response."""
+        if self._json is None:
+            self._json = _dumps(self.to_dict()).encode()
+        return self._json
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # largest_trade is shared, not deep-copied; callers only read it
+        return {
+            "timestamp": self.timestamp,
+            "ticker": self.ticker,
+            "net_premium_calls": self.net_premium_calls,
+            "net_premium_puts": self.net_premium_puts,
+            "premium_ratio": self.premium_ratio,
+            "sweep_count_calls": self.sweep_count_calls,
+            "sweep_count_puts": self.sweep_count_puts,
+            "largest_trade": self.largest_trade,
+            "institutional_bias": self.institutional_bias,
+            "confidence": self.confidence,
+            "total_trades_analyzed": self.total_trades_analyzed,
+            "haiku_analysis": self.haiku_analysis,
+            "latency_ms": self.latency_ms,
+        }
 
 
 class FlowDecoder:
@@ -75,9 +241,19 @@ class FlowDecoder:
         self.alpaca_key = os.environ.get("ALPACA_API_KEY", "")
         self.alpaca_secret = os.environ.get("ALPACA_SECRET_KEY", "")
         self.bedrock = get_bedrock_client()
+        self._http = self._init_http()
         self.last_snapshot: Optional[FlowSnapshot] = None
         self.last_update: Optional[datetime] = None
+        self._mod_cache: Optional[tuple] = None   # (snapshot, direction, result)
+        self._pending: List[tuple] = []
+        self._haiku_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+        self._haiku_cache_window = 0
+        self._haiku_lock = threading.Lock()   # calculate_many classifies from worker threads
+        self._haiku_cache_hits = 0
+        self._haiku_cache_misses = 0
+        self._last_flush = time.monotonic()
         self._init_db()
+        atexit.register(self._flush_history)
 
         # System prompt for Haiku (cached for efficiency)
         self.system_prompt = """You are an institutional options flow analyst. Your job is to classify market sentiment based on options trading data.
@@ -93,14 +269,39 @@ Rules:
 
 Always respond with valid JSON only, no explanations."""
 
+    def _init_http(self):
+        """Keep-alive session so each poll reuses the TLS connection to Alpaca."""
+        if not HAS_REQUESTS:
+            return None
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Accept": "application/json",
+            "APCA-API-KEY-ID": self.alpaca_key,
+            "APCA-API-SECRET-KEY": self.alpaca_secret
+        })
+        return session
+
     def _init_db(self):
-        """Initialize SQLite database for flow history."""
+        """Open the long-lived SQLite connection for flow history."""
+        self._conn: Optional[sqlite3.Connection] = None
         try:
             DATA_DIR.mkdir(parents=True, exist_ok=True)
-            conn = sqlite3.connect(str(FLOW_DB))
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            conn = sqlite3.connect(
+                str(FLOW_DB), isolation_level=None, check_same_thread=False, cached_statements=128
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS flow_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     timestamp TEXT NOT NULL,
@@ -112,35 +313,40 @@ Always respond with valid JSON only, no explanations."""
                     haiku_analysis TEXT
                 )
             """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_flow_ticker_ts ON flow_history(ticker, timestamp DESC)"
+            )
 
-            conn.commit()
-            conn.close()
+            self._conn = conn
         except Exception as e:
             log.error(f"Flow database init error: {e}")
 
     def _save_to_history(self, snapshot: FlowSnapshot):
-        """Save snapshot to database."""
+        """Queue snapshot for the next batched history write."""
+        self._pending.append((
+            snapshot.timestamp,
+            snapshot.ticker,
+            snapshot.net_premium_calls,
+            snapshot.net_premium_puts,
+            snapshot.institutional_bias,
+            snapshot.confidence,
+            snapshot.haiku_analysis
+        ))
+
+    def _flush_history(self):
+        """Write all queued snapshots in a single transaction."""
+        self._last_flush = time.monotonic()
+        if self._conn is None or not self._pending:
+            return
+
         try:
-            conn = sqlite3.connect(str(FLOW_DB))
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT INTO flow_history
-                (timestamp, ticker, net_premium_calls, net_premium_puts, institutional_bias, confidence, haiku_analysis)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                snapshot.timestamp,
-                snapshot.ticker,
-                snapshot.net_premium_calls,
-                snapshot.net_premium_puts,
-                snapshot.institutional_bias,
-                snapshot.confidence,
-                snapshot.haiku_analysis
-            ))
-
-            conn.commit()
-            conn.close()
+            self._conn.execute("BEGIN")
+            self._conn.executemany(_INSERT_SQL, self._pending)
+            self._conn.execute("COMMIT")
+            self._pending.clear()
         except Exception as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
             log.error(f"Flow history save error: {e}")
 
     def _fetch_options_trades(self, ticker: str = "SPY", limit: int = 500) -> List[dict]:
@@ -152,11 +358,6 @@ Always respond with valid JSON only, no explanations."""
             # Alpaca options trades endpoint
             url = "https://data.alpaca.markets/v1beta1/options/trades"
 
-            headers = {
-                "APCA-API-KEY-ID": self.alpaca_key,
-                "APCA-API-SECRET-KEY": self.alpaca_secret
-            }
-
             # Get trades for SPY options (all expirations)
             params = {
                 "symbols": f"{ticker}*",  # Wildcard for all SPY options
@@ -164,18 +365,9 @@ Always respond with valid JSON only, no explanations."""
                 "sort": "desc"
             }
 
-            resp = requests.get(url, headers=headers, params=params, timeout=15)
-            if resp.status_code == 200:
-                data = resp.json()
-                # Alpaca returns trades nested under symbol keys
-                all_trades = []
-                trades_dict = data.get("trades", {})
-                for symbol, trades in trades_dict.items():
-                    for trade in trades:
-                        trade["symbol"] = symbol  # Add symbol to each trade
-                        all_trades.append(trade)
-                return all_trades
-            else:
+            with self._http.get(url, params=params, timeout=15, stream=HAS_IJSON) as resp:
+                if resp.status_code == 200:
+                    return self._parse_trades(resp)
                 log.warning(f"Alpaca options trades fetch failed: {resp.status_code}")
                 return []
 
@@ -183,11 +375,31 @@ Always respond with valid JSON only, no explanations."""
             log.error(f"Options trades fetch error: {e}")
             return []
 
+    def _parse_trades(self, resp) -> List[dict]:
+        """Flatten Alpaca's {symbol: [trades]} payload into a list of trades."""
+        if HAS_IJSON:
+            # Stream symbol -> trades pairs without materializing the whole document
+            resp.raw.decode_content = True
+            symbol_trades = ijson.kvitems(resp.raw, "trades", use_float=True)
+        else:
+            data = orjson.loads(resp.content) if HAS_ORJSON else resp.json()
+            symbol_trades = data.get("trades", {}).items()
+
+        all_trades = []
+        for symbol, trades in symbol_trades:
+            for trade in trades:
+                trade["symbol"] = symbol  # Add symbol to each trade
+                all_trades.append(trade)
+        return all_trades
+
     def _aggregate_flow(self, trades: List[dict]) -> dict:
         """
         Aggregate flow data from Alpaca trades.
         Alpaca format: {t: timestamp, x: exchange, p: price, s: size, c: conditions, symbol: "SPY260225C00550000"}
         """
+        if HAS_NUMPY and trades:
+            return self._aggregate_flow_numpy(trades)
+
         call_premium = 0
         put_premium = 0
         call_sweeps = 0
@@ -199,12 +411,12 @@ Always respond with valid JSON only, no explanations."""
             # Parse option symbol to determine call/put
             # Alpaca format: SPY260225C00550000
             symbol = trade.get("symbol", "")
-            if len(symbol) < 15:
+            match = OPTION_SYMBOL_RE.match(symbol)
+            if not match:
                 continue
 
-            # Find C or P in the symbol (after date portion)
-            is_call = "C" in symbol[6:10]
-            is_put = "P" in symbol[6:10]
+            is_call = match.group(3) == "C"
+            is_put = not is_call
 
             price = trade.get("p", 0)
             size = trade.get("s", 0)
@@ -217,7 +429,7 @@ Always respond with valid JSON only, no explanations."""
 
             # Check if sweep - Alpaca uses different condition codes
             # Sweeps are typically indicated by intermarket sweep conditions
-            is_sweep = any(c in ["I", "K", "M"] for c in conditions)  # Intermarket sweep conditions
+            is_sweep = not SWEEP_CONDITIONS.isdisjoint(conditions)
 
             if is_call:
                 call_premium += premium
@@ -232,7 +444,7 @@ Always respond with valid JSON only, no explanations."""
             if premium > largest_premium:
                 largest_premium = premium
                 largest_trade = {
-                    "type": "CALL_SWEEP" if is_call and is_sweep else "CALL" if is_call else "PUT_SWEEP" if is_sweep else "PUT",
+                    "type": TRADE_LABELS[(is_call << 1) | is_sweep],
                     "premium": premium,
                     "ticker": symbol,
                     "size": size,
@@ -248,19 +460,70 @@ Always respond with valid JSON only, no explanations."""
             "total_trades": len(trades)
         }
 
+    def _aggregate_flow_numpy(self, trades: List[dict]) -> dict:
+        """Columnar (SoA) version of _aggregate_flow; reduction runs in _flow_reduce."""
+        n = len(trades)
+        symbols = [trade.get("symbol", "") for trade in trades]
+
+        prices = np.fromiter((t.get("p", 0) for t in trades), dtype=np.float64, count=n)
+        sizes = np.fromiter((t.get("s", 0) for t in trades), dtype=np.float64, count=n)
+        matches = [OPTION_SYMBOL_RE.match(sym) for sym in symbols]
+        sides = [m.group(3) if m else "" for m in matches]
+        valid = np.fromiter((side != "" for side in sides), dtype=bool, count=n)
+        calls = np.fromiter((side == "C" for side in sides), dtype=bool, count=n)
+        puts = np.fromiter((side == "P" for side in sides), dtype=bool, count=n)
+        sweeps = np.fromiter(
+            (not SWEEP_CONDITIONS.isdisjoint(t.get("c", ())) for t in trades),
+            dtype=bool, count=n
+        )
+
+        premium = prices * sizes * 100
+        counted = valid & (premium >= MIN_PREMIUM_SWEEP)
+        call_premium, put_premium, call_sweeps, put_sweeps, idx = _flow_reduce(
+            premium, counted, calls, puts, sweeps
+        )
+
+        largest_trade = {}
+        if idx >= 0:
+            is_call, is_sweep = bool(calls[idx]), bool(sweeps[idx])
+            largest_trade = {
+                "type": TRADE_LABELS[(is_call << 1) | is_sweep],
+                "premium": float(premium[idx]),
+                "ticker": symbols[idx],
+                "size": trades[idx].get("s", 0),
+                "price": trades[idx].get("p", 0)
+            }
+
+        return {
+            "call_premium": float(call_premium),
+            "put_premium": float(put_premium),
+            "call_sweeps": int(call_sweeps),
+            "put_sweeps": int(put_sweeps),
+            "largest_trade": largest_trade,
+            "total_trades": n
+        }
+
     def _classify_with_haiku(self, flow_data: dict, ticker: str) -> dict:
         """Use Claude Haiku to classify the flow."""
         if not self.bedrock.is_available:
             # Fallback to rule-based classification
             return self._rule_based_classification(flow_data)
 
+        if self._is_unambiguous(flow_data):
+            log.debug(f"Flow classification path: rule-based (unambiguous) for {ticker}")
+            return self._rule_based_classification(flow_data)
+        cached = self._haiku_cache_lookup(flow_data, ticker)
+        if cached is not None:
+            return cached
+        log.debug(f"Flow classification path: haiku for {ticker}")
+
         prompt = f"""Analyze this options flow for {ticker}:
 
 Call Premium: ${flow_data['call_premium']:,.0f}
 Put Premium: ${flow_data['put_premium']:,.0f}
 Call Sweeps: {flow_data['call_sweeps']}
 Put Sweeps: {flow_data['put_sweeps']}
-Largest Trade: {json.dumps(flow_data['largest_trade'])}
+Largest Trade: {_dumps(flow_data['largest_trade'])}
 Total Trades: {flow_data['total_trades']}
 
 Respond with JSON:
@@ -278,18 +541,67 @@ Respond with JSON:
         )
 
         if response.success:
-            try:
-                # Parse JSON response
-                result = json.loads(response.content)
-                result["latency_ms"] = response.latency_ms
-                result["haiku_raw"] = response.content
-                return result
-            except json.JSONDecodeError:
+            result = _parse_json_object(response.content)
+            if result is None:
                 log.warning(f"Failed to parse Haiku response: {response.content}")
                 return self._rule_based_classification(flow_data)
-        else:
-            log.warning(f"Haiku classification failed: {response.error}")
-            return self._rule_based_classification(flow_data)
+
+            result["latency_ms"] = response.latency_ms
+            result["haiku_raw"] = response.content
+            self._haiku_cache_store(flow_data, ticker, result)
+            return result
+        log.warning(f"Haiku classification failed: {response.error}")
+        return self._rule_based_classification(flow_data)
+
+    def _haiku_cache_key(self, flow_data: dict, ticker: str) -> tuple:
+        """Quantize flow features so near-identical polls share a cache entry."""
+        return (
+            ticker,
+            round(math.log10(flow_data["call_premium"] + 1), 1),
+            round(math.log10(flow_data["put_premium"] + 1), 1),
+            flow_data["call_sweeps"],
+            flow_data["put_sweeps"],
+        )
+
+    def _haiku_cache_lookup(self, flow_data: dict, ticker: str) -> Optional[dict]:
+        """Return a cached classification, resetting the cache each TTL window."""
+        key = self._haiku_cache_key(flow_data, ticker)
+        window = int(time.time() // HAIKU_CACHE_TTL_SECONDS)
+        with self._haiku_lock:
+            if window != self._haiku_cache_window:
+                self._haiku_cache.clear()
+                self._haiku_cache_window = window
+
+            cached = self._haiku_cache.get(key)
+            if cached is None:
+                self._haiku_cache_misses += 1
+                return None
+
+            self._haiku_cache.move_to_end(key)
+            self._haiku_cache_hits += 1
+        total = self._haiku_cache_hits + self._haiku_cache_misses
+        log.debug(f"Flow classification path: haiku cache hit ({self._haiku_cache_hits}/{total})")
+        return {**cached, "latency_ms": 0}
+
+    def _haiku_cache_store(self, flow_data: dict, ticker: str, result: dict) -> None:
+        """Cache a classification, evicting the least recently used entry."""
+        key = self._haiku_cache_key(flow_data, ticker)
+        with self._haiku_lock:
+            self._haiku_cache[key] = result
+            if len(self._haiku_cache) > HAIKU_CACHE_SIZE:
+                self._haiku_cache.popitem(last=False)
+
+    def _is_unambiguous(self, flow_data: dict) -> bool:
+        """True when flow is too small or too one-sided to need Haiku."""
+        call_premium = flow_data["call_premium"]
+        put_premium = flow_data["put_premium"]
+
+        if call_premium + put_premium < HAIKU_MIN_TOTAL_PREMIUM:
+            return True
+
+        ratio = call_premium / put_premium if put_premium > 0 else 10
+        low, high = HAIKU_RATIO_BAND
+        return ratio > high or ratio < low
 
     def _rule_based_classification(self, flow_data: dict) -> dict:
         """Fallback rule-based classification when Haiku unavailable."""
@@ -305,24 +617,15 @@ Respond with JSON:
                 "haiku_raw": "fallback"
             }
 
-        total = call_premium + put_premium
         ratio = call_premium / put_premium if put_premium > 0 else 10
 
-        if ratio > 2.5:
-            bias = "AGGRESSIVELY_BULLISH"
-            confidence = min(95, 70 + (ratio - 2) * 10)
-        elif ratio > 1.5:
-            bias = "MODERATELY_BULLISH"
-            confidence = 70
-        elif ratio < 0.4:
-            bias = "AGGRESSIVELY_BEARISH"
-            confidence = min(95, 70 + (1/ratio - 2) * 10)
-        elif ratio < 0.67:
-            bias = "MODERATELY_BEARISH"
-            confidence = 70
-        else:
-            bias = "NEUTRAL"
-            confidence = 60
+        idx = bisect.bisect_left(RATIO_EDGES, ratio)
+        bias = BIAS_AT_BIN[idx]
+        confidence = CONFIDENCE_AT_BIN[idx]
+        if confidence is None:
+            # Aggressive bins scale with how lopsided the flow is
+            strength = ratio if idx else (1 / ratio if ratio > 0 else 10)
+            confidence = min(95, 70 + (strength - 2) * 10)
 
         return {
             "institutional_bias": bias,
@@ -337,7 +640,29 @@ Respond with JSON:
         Calculate flow classification.
         This is the main method called every 2 minutes.
         """
-        timestamp = datetime.now(timezone.utc).isoformat()
+        now = datetime.now(timezone.utc)
+        snapshot = self._build_snapshot(ticker, now)
+        self._record_snapshot(snapshot, now)
+        return snapshot
+
+    async def calculate_async(self, ticker: str = "SPY") -> FlowSnapshot:
+        """
+        Async variant of calculate().
+        The blocking Alpaca/Bedrock I/O runs in a worker thread; history and
+        last_snapshot are updated back on the event loop.
+        """
+        now = datetime.now(timezone.utc)
+        snapshot = await asyncio.to_thread(self._build_snapshot, ticker, now)
+        self._record_snapshot(snapshot, now)
+        return snapshot
+
+    async def calculate_many(self, tickers: List[str]) -> List[FlowSnapshot]:
+        """Calculate flow for several tickers with their I/O overlapped."""
+        return list(await asyncio.gather(*(self.calculate_async(t) for t in tickers)))
+
+    def _build_snapshot(self, ticker: str, now: datetime) -> FlowSnapshot:
+        """Fetch, aggregate and classify flow for one ticker."""
+        timestamp = now.isoformat()
 
         # Fetch options trades
         trades = self._fetch_options_trades(ticker)
@@ -377,12 +702,17 @@ Respond with JSON:
             f"Bias: {classification['institutional_bias']} ({classification['confidence']}%)"
         )
 
-        # Save to history
+        return snapshot
+
+    def _record_snapshot(self, snapshot: FlowSnapshot, now: datetime):
+        """Persist snapshot and make it the latest."""
         self._save_to_history(snapshot)
+        if (len(self._pending) >= HISTORY_FLUSH_ROWS
+                or time.monotonic() - self._last_flush >= HISTORY_FLUSH_SECONDS):
+            self._flush_history()
         self.last_snapshot = snapshot
-        self.last_update = datetime.now(timezone.utc)
-
-        return snapshot
+        self.last_update = now
+        self._mod_cache = None
 
     def get_last_snapshot(self) -> Optional[FlowSnapshot]:
         """Get the most recent flow snapshot."""
@@ -402,25 +732,20 @@ Respond with JSON:
             return {"modifier": 0, "reasons": ["No flow data"]}
 
         flow = self.last_snapshot
+        cache = self._mod_cache
+        if cache and cache[0] is flow and cache[1] == trade_direction:
+            return cache[2]
+
         modifier = 0
         reasons = []
 
         # Check alignment with trade direction
-        if trade_direction == "BULLISH":
-            if flow.institutional_bias in ("AGGRESSIVELY_BULLISH", "MODERATELY_BULLISH"):
-                modifier += 10 if "AGGRESSIVELY" in flow.institutional_bias else 5
-                reasons.append(f"Flow aligns: {flow.institutional_bias}")
-            elif flow.institutional_bias in ("AGGRESSIVELY_BEARISH", "MODERATELY_BEARISH"):
-                modifier -= 10 if "AGGRESSIVELY" in flow.institutional_bias else 5
-                reasons.append(f"Flow conflicts: {flow.institutional_bias}")
-
-        elif trade_direction == "BEARISH":
-            if flow.institutional_bias in ("AGGRESSIVELY_BEARISH", "MODERATELY_BEARISH"):
-                modifier += 10 if "AGGRESSIVELY" in flow.institutional_bias else 5
-                reasons.append(f"Flow aligns: {flow.institutional_bias}")
-            elif flow.institutional_bias in ("AGGRESSIVELY_BULLISH", "MODERATELY_BULLISH"):
-                modifier -= 10 if "AGGRESSIVELY" in flow.institutional_bias else 5
-                reasons.append(f"Flow conflicts: {flow.institutional_bias}")
+        bias_sign, magnitude = BIAS_TABLE.get(flow.institutional_bias, (0, 0))
+        alignment = DIRECTION_SIGN.get(trade_direction, 0) * bias_sign
+        if alignment:
+            modifier += alignment * magnitude
+            verb = "aligns" if alignment > 0 else "conflicts"
+            reasons.append(f"Flow {verb}: {flow.institutional_bias}")
 
         # Sweep activity bonus
         if trade_direction == "BULLISH" and flow.sweep_count_calls > flow.sweep_count_puts * 2:
@@ -430,12 +755,14 @@ Respond with JSON:
             modifier += 5
             reasons.append(f"Put sweeps dominant ({flow.sweep_count_puts} vs {flow.sweep_count_calls})")
 
-        return {
+        result = {
             "modifier": modifier,
             "reasons": reasons,
             "institutional_bias": flow.institutional_bias,
             "confidence": flow.confidence
         }
+        self._mod_cache = (flow, trade_direction, result)
+        return result
 
 
 # Singleton instance
@@ -18,26 +18,72 @@ Outputs:
 """
 
 import os
+import json
+import asyncio
 import math
+import atexit
+import bisect
+import heapq
 import logging
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, time, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 from enum import Enum
+from time import monotonic
 
 log = logging.getLogger("HYDRA.GEX")
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Prefer the ahead-of-time build (python _build_gex_kernels.py), then the JIT kernel
+try:
+    from _gex_kernels_aot import gex_kernel
+    HAS_GEX_KERNEL = True
+except ImportError:
+    try:
+        from _gex_kernels import gex_kernel, HAS_NUMBA as HAS_GEX_KERNEL
+    except ImportError:
+        HAS_GEX_KERNEL = False
+
 # Data directory
 DATA_DIR = Path(__file__).parent.parent / "data"
 GEX_DB = DATA_DIR / "gex_history.db"
+GEX_HISTORY_BIN = DATA_DIR / "gex_history.bin"
+GEX_HISTORY_HEAD = DATA_DIR / "gex_history.head"
+
+# Fixed-size append-only ring of snapshots (NumPy memmap); SQLite is the fallback
+HISTORY_RING_SIZE = 10_000
+
+# SQLite fallback: rows are buffered and written in one transaction every N snapshots
+HISTORY_FLUSH_ROWS = 10
+
+_INSERT_SQL = (
+    "INSERT INTO gex_history "
+    "(timestamp, spot_price, total_gex, call_gex, put_gex, flip_point, regime, charm_flow, vanna_exposure) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
 
 
 class GEXRegime(Enum):
@@ -47,6 +93,23 @@ class GEXRegime(Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Regime <-> uint8 code for the history ring
+REGIME_CODES = {regime.value: code for code, regime in enumerate(GEXRegime)}
+
+if HAS_NUMPY:
+    HIST_DTYPE = np.dtype([
+        ("ts", "i8"),          # epoch milliseconds (UTC)
+        ("spot", "f4"),
+        ("total_gex", "f8"),
+        ("call_gex", "f8"),
+        ("put_gex", "f8"),
+        ("flip", "f4"),        # NaN when there is no flip point
+        ("regime", "u1"),      # REGIME_CODES
+        ("charm", "f8"),
+        ("vanna", "f8"),
+    ])
+
+
 class RefreshInterval(Enum):
     REALTIME = 30      # 30 seconds - final hour
     FAST = 60          # 1 minute - open, power hour
@@ -54,6 +117,22 @@ class RefreshInterval(Enum):
     SLOW = 900         # 15 minutes - pre-market
 
 
+# Time-of-day baseline (HHMM, local): before 9:30 SLOW, open FAST, mid-day NORMAL,
+# 14:00 FAST, final hour REALTIME
+_REFRESH_CUTOFFS = (930, 1000, 1400, 1500)
+_REFRESH_BASELINES = (
+    RefreshInterval.SLOW,
+    RefreshInterval.FAST,
+    RefreshInterval.NORMAL,
+    RefreshInterval.FAST,
+    RefreshInterval.REALTIME,
+)
+
+
+# Dealer-positioning sign per Polygon contract_type, resolved once at parse time.
+# Anything that is not a call has always been treated as a put.
+CONTRACT_DIRECTION = {"call": 1, "put": -1}
+
 # GEX thresholds for SPY (in dollars)
 GEX_THRESHOLDS = {
     "extreme_positive": 1_000_000_000,    # $1B - strong pin
@@ -85,7 +164,30 @@ class GEXSnapshot:
     options_count: int
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        """Display form: full precision is kept internally and rounded only here."""
+        return {
+            "timestamp": self.timestamp,
+            "spot_price": round(self.spot_price, 2),
+            "total_gex": round(self.total_gex, 0),
+            "call_gex": round(self.call_gex, 0),
+            "put_gex": round(self.put_gex, 0),
+            "flip_point": round(self.flip_point, 2) if self.flip_point else None,
+            "flip_distance_pct": round(self.flip_distance_pct, 4),
+            "regime": self.regime,
+            "charm_flow_per_hour": round(self.charm_flow_per_hour, 0),
+            "vanna_exposure": round(self.vanna_exposure, 0),
+            "key_support": self.key_support,
+            "key_resistance": self.key_resistance,
+            "magnets": self.magnets,
+            "refresh_interval_seconds": self.refresh_interval_seconds,
+            "options_count": self.options_count,
+        }
+
+    def to_json(self) -> bytes:
+        """Serialized to_dict(), via orjson when installed."""
+        if HAS_ORJSON:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode()
 
 
 def calculate_gex_per_strike(
@@ -126,21 +228,19 @@ def calculate_charm(
 
     For 0DTE options, charm is extreme near ATM strikes.
     """
-    if time_to_expiry_years <= 0 or iv <= 0 or spot <= 0 or strike <= 0:
+    # Guards keep log/sqrt/division in-domain, so no exception handling is needed
+    if time_to_expiry_years <= 0 or not iv > 0 or spot <= 0 or strike <= 0:
         return 0.0
 
-    try:
-        tau = time_to_expiry_years
-        sigma = iv
+    tau = time_to_expiry_years
+    sigma = iv
 
-        d1 = (math.log(spot / strike) + (0.05 + sigma**2 / 2) * tau) / (sigma * math.sqrt(tau))
+    d1 = (math.log(spot / strike) + (0.05 + sigma**2 / 2) * tau) / (sigma * math.sqrt(tau))
 
-        # Simplified charm formula
-        charm = -gamma * (0.05 - d1 * sigma / (2 * tau))
+    # Simplified charm formula
+    charm = -gamma * (0.05 - d1 * sigma / (2 * tau))
 
-        return charm
-    except (ValueError, ZeroDivisionError):
-        return 0.0
+    return charm
 
 
 def calculate_vanna(
@@ -156,20 +256,60 @@ def calculate_vanna(
 
     When IV changes, delta changes, forcing dealers to re-hedge.
     """
-    if time_to_expiry_years <= 0 or iv <= 0 or spot <= 0 or vega == 0:
+    # Guards keep log/sqrt/division in-domain, so no exception handling is needed
+    if time_to_expiry_years <= 0 or not iv > 0 or spot <= 0 or strike <= 0 or vega == 0:
         return 0.0
 
-    try:
-        tau = time_to_expiry_years
-        sigma = iv
+    tau = time_to_expiry_years
+    sigma = iv
 
-        d1 = (math.log(spot / strike) + (0.05 + sigma**2 / 2) * tau) / (sigma * math.sqrt(tau))
+    d1 = (math.log(spot / strike) + (0.05 + sigma**2 / 2) * tau) / (sigma * math.sqrt(tau))
 
-        vanna = vega * d1 / (spot * sigma * math.sqrt(tau))
+    vanna = vega * d1 / (spot * sigma * math.sqrt(tau))
 
-        return vanna
-    except (ValueError, ZeroDivisionError):
-        return 0.0
+    return vanna
+
+
+def _greeks_combined(
+    gamma: float,
+    vega: float,
+    iv: float,
+    spot: float,
+    strike: float,
+    tau: float,
+    sqrt_tau: float
+) -> tuple:
+    """
+    Charm and vanna for one option from a single d1 evaluation.
+    sqrt_tau is passed in because it is shared by every option in a snapshot.
+    Returns (charm, vanna), matching calculate_charm / calculate_vanna.
+    """
+    if tau <= 0 or not iv > 0 or spot <= 0 or strike <= 0:
+        return 0.0, 0.0
+
+    d1 = (math.log(spot / strike) + (0.05 + iv * iv * 0.5) * tau) / (iv * sqrt_tau)
+    charm = -gamma * (0.05 - d1 * iv / (2 * tau))
+    vanna = vega * d1 / (spot * iv * sqrt_tau) if vega != 0 else 0.0
+    return charm, vanna
+
+
+def _flip_point_numpy(gex_by_strike: Dict[float, float], spot_price: float) -> Optional[float]:
+    """Vectorized find_gamma_flip_point: cumsum over sorted strikes, then sign-change search."""
+    strikes_arr = np.fromiter(gex_by_strike.keys(), dtype=np.float64, count=len(gex_by_strike))
+    order = np.argsort(strikes_arr)
+    strikes_sorted = strikes_arr[order]
+    gex_sorted = np.fromiter(gex_by_strike.values(), dtype=np.float64, count=len(gex_by_strike))[order]
+
+    cum = np.cumsum(gex_sorted)
+    signs = np.sign(cum)
+    idx = np.where(signs[:-1] * signs[1:] < 0)[0]
+    if len(idx) == 0:
+        return None
+
+    g1 = np.abs(cum[idx])
+    g2 = np.abs(cum[idx + 1])
+    flips = strikes_sorted[idx] + (strikes_sorted[idx + 1] - strikes_sorted[idx]) * g1 / (g1 + g2)
+    return float(flips[np.argmin(np.abs(flips - spot_price))])
 
 
 def find_gamma_flip_point(gex_by_strike: Dict[float, float], spot_price: float) -> Optional[float]:
@@ -180,6 +320,9 @@ def find_gamma_flip_point(gex_by_strike: Dict[float, float], spot_price: float)
     if not gex_by_strike:
         return None
 
+    if HAS_NUMPY:
+        return _flip_point_numpy(gex_by_strike, spot_price)
+
     strikes = sorted(gex_by_strike.keys())
 
     # Calculate cumulative GEX from lowest strike upward
@@ -223,14 +366,14 @@ def identify_key_levels(
     if not gex_by_strike:
         return {"support": [], "resistance": [], "magnets": []}
 
-    # Sort by absolute GEX magnitude
-    sorted_strikes = sorted(gex_by_strike.items(), key=lambda x: abs(x[1]), reverse=True)
+    # Only the top_n * 2 largest |GEX| strikes matter, so skip the full sort
+    top_strikes = heapq.nlargest(top_n * 2, gex_by_strike.items(), key=lambda x: abs(x[1]))
 
     support = []
     resistance = []
     magnets = []
 
-    for strike, gex in sorted_strikes[:top_n * 2]:
+    for strike, gex in top_strikes:
         if gex > 0:  # Positive GEX = magnet
             magnets.append(strike)
             if strike < spot_price:
@@ -241,7 +384,7 @@ def identify_key_levels(
     return {
         "support": sorted(support, reverse=True)[:top_n],
         "resistance": sorted(resistance)[:top_n],
-        "magnets": sorted(magnets, key=lambda x: abs(x - spot_price))[:top_n]
+        "magnets": heapq.nsmallest(top_n, magnets, key=lambda x: abs(x - spot_price))
     }
 
 
@@ -253,19 +396,9 @@ def get_refresh_interval(
     """
     Determine optimal refresh interval based on market conditions.
     """
-    t = current_time.time()
-
     # Time-based baseline
-    if t < time(9, 30):
-        baseline = RefreshInterval.SLOW
-    elif t < time(10, 0):
-        baseline = RefreshInterval.FAST
-    elif t < time(14, 0):
-        baseline = RefreshInterval.NORMAL
-    elif t < time(15, 0):
-        baseline = RefreshInterval.FAST
-    else:
-        baseline = RefreshInterval.REALTIME
+    hhmm = current_time.hour * 100 + current_time.minute
+    baseline = _REFRESH_BASELINES[bisect.bisect_right(_REFRESH_CUTOFFS, hhmm)]
 
     # Near flip point = increase frequency
     if flip_point_distance < 0.005:  # Within 0.5%
@@ -291,6 +424,36 @@ def get_time_to_expiry_years() -> float:
     return max(time_remaining / (365.25 * 24 * 3600), 1e-6)
 
 
+def _chain_totals(cols: Dict[str, Any], spot_price: float, tau: float) -> tuple:
+    """
+    NumPy totals over valid options.
+    Returns (total_gex, call_gex, put_gex, total_charm, total_vanna, per_option_gex).
+    """
+    strike, oi, gamma = cols["strike"], cols["open_interest"], cols["gamma"]
+    vega, iv, direction = cols["vega"], cols["iv"], cols["direction"]
+
+    gex = np.where(gamma > 0, gamma * oi * 100 * spot_price ** 2 * direction, 0.0)
+
+    # Charm/vanna share d1; rows with missing (NaN) or zero IV, or no time left, contribute zero
+    greeks_ok = (iv > 0) & (tau > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sqrt_tau = math.sqrt(tau) if tau > 0 else 0.0
+        log_moneyness = np.log(spot_price / strike)
+        d1 = (log_moneyness + (0.05 + iv * iv * 0.5) * tau) / (iv * sqrt_tau)
+        charm = np.where(greeks_ok, -gamma * (0.05 - d1 * iv / (2 * tau)), 0.0)
+        vanna = np.where(greeks_ok & (vega != 0), vega * d1 / (spot_price * iv * sqrt_tau), 0.0)
+
+    is_call = direction > 0
+    return (
+        gex.sum(),
+        gex[is_call].sum(),
+        gex[~is_call].sum(),
+        (charm * oi * 100 * direction).sum(),
+        (vanna * oi * 100 * direction).sum(),
+        gex,
+    )
+
+
 class GEXEngine:
     """
     Real-time GEX computation engine for HYDRA.
@@ -306,18 +469,51 @@ class GEXEngine:
     def __init__(self, polygon_api_key: str = None):
         self.api_key = polygon_api_key or os.environ.get("POLYGON_API_KEY", "")
         self.last_snapshot: Optional[GEXSnapshot] = None
-        self.last_update: Optional[datetime] = None
+        self.last_update: Optional[datetime] = None  # display only; should_refresh uses the monotonic clock
+        self._last_update_monotonic: Optional[float] = None
         self.refresh_interval = RefreshInterval.NORMAL
+        self._pending: List[tuple] = []
+        self._chain_cache: Optional[tuple] = None  # (monotonic seconds, options, spot)
+        # History appends come from the GEX loop thread and calculate_async workers
+        self._history_lock = threading.Lock()
+        self._session = self._init_http()
         self._init_db()
+        atexit.register(self.flush)
+
+    def _init_http(self):
+        """Keep-alive session so chain pages and refreshes reuse the TLS connection to Polygon."""
+        if not HAS_REQUESTS:
+            return None
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=3,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        session.mount("https://", adapter)
+        session.headers.update({"Accept-Encoding": "gzip"})
+        return session
 
     def _init_db(self):
-        """Initialize SQLite database for GEX history."""
+        """Open GEX history storage: the memmap ring with NumPy, else a long-lived SQLite connection."""
+        self._conn: Optional[sqlite3.Connection] = None
+        self._ring = None
+        self._ring_head = None
+
+        if HAS_NUMPY:
+            self._init_ring()
+            return
+
         try:
             DATA_DIR.mkdir(parents=True, exist_ok=True)
-            conn = sqlite3.connect(str(GEX_DB))
-            cursor = conn.cursor()
+            conn = sqlite3.connect(str(GEX_DB), isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
 
-            cursor.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS gex_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     timestamp TEXT NOT NULL,
@@ -331,23 +527,54 @@ class GEXEngine:
                     vanna_exposure REAL
                 )
             """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_gex_ts ON gex_history(timestamp)")
 
-            conn.commit()
-            conn.close()
+            self._conn = conn
         except Exception as e:
             log.error(f"GEX database init error: {e}")
 
-    def _save_to_history(self, snapshot: GEXSnapshot):
-        """Save snapshot to database."""
+    def _init_ring(self):
+        """Map the history ring and its head counter, creating or resizing them as needed."""
         try:
-            conn = sqlite3.connect(str(GEX_DB))
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT INTO gex_history
-                (timestamp, spot_price, total_gex, call_gex, put_gex, flip_point, regime, charm_flow, vanna_exposure)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            DATA_DIR.mkdir(parents=True, exist_ok=True)
+            ring_bytes = HISTORY_RING_SIZE * HIST_DTYPE.itemsize
+            fresh = (
+                not GEX_HISTORY_HEAD.exists()
+                or not GEX_HISTORY_BIN.exists()
+                or GEX_HISTORY_BIN.stat().st_size != ring_bytes
+            )
+
+            mode = "w+" if fresh else "r+"
+            self._ring = np.memmap(GEX_HISTORY_BIN, dtype=HIST_DTYPE, mode=mode, shape=(HISTORY_RING_SIZE,))
+            self._ring_head = np.memmap(GEX_HISTORY_HEAD, dtype=np.int64, mode=mode, shape=(1,))
+        except Exception as e:
+            self._ring = self._ring_head = None
+            log.error(f"GEX history ring init error: {e}")
+
+    def _save_to_history(self, snapshot: GEXSnapshot):
+        """Append snapshot to history storage."""
+        if self._ring is not None:
+            row = (
+                int(datetime.fromisoformat(snapshot.timestamp).timestamp() * 1000),
+                snapshot.spot_price,
+                snapshot.total_gex,
+                snapshot.call_gex,
+                snapshot.put_gex,
+                snapshot.flip_point if snapshot.flip_point is not None else np.nan,
+                REGIME_CODES.get(snapshot.regime, REGIME_CODES[GEXRegime.UNKNOWN.value]),
+                snapshot.charm_flow_per_hour,
+                snapshot.vanna_exposure
+            )
+            # Head read, slot write and head bump must not interleave across threads
+            with self._history_lock:
+                head = int(self._ring_head[0])
+                self._ring[head % HISTORY_RING_SIZE] = row
+                self._ring_head[0] = head + 1
+            return
+
+        # SQLite fallback: queue and flush every HISTORY_FLUSH_ROWS rows
+        with self._history_lock:
+            self._pending.append((
                 snapshot.timestamp,
                 snapshot.spot_price,
                 snapshot.total_gex,
@@ -358,11 +585,40 @@ class GEXEngine:
                 snapshot.charm_flow_per_hour,
                 snapshot.vanna_exposure
             ))
-
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            log.error(f"GEX history save error: {e}")
+            due = len(self._pending) >= HISTORY_FLUSH_ROWS
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Persist history: msync the ring, or write queued SQLite rows in one transaction."""
+        with self._history_lock:
+            if self._ring is not None:
+                self._ring.flush()
+                self._ring_head.flush()
+                return
+
+            if self._conn is None or not self._pending:
+                return
+
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(_INSERT_SQL, self._pending)
+                self._conn.execute("COMMIT")
+                self._pending.clear()
+            except Exception as e:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                log.error(f"GEX history save error: {e}")
+
+    def get_history(self, n: int = 100):
+        """Last n snapshots from the history ring, oldest first (structured HIST_DTYPE array)."""
+        if self._ring is None:
+            return None
+
+        with self._history_lock:
+            head = int(self._ring_head[0])
+            n = min(n, head, HISTORY_RING_SIZE)
+            return self._ring[np.arange(head - n, head) % HISTORY_RING_SIZE]
 
     def _fetch_spot_price(self) -> float:
         """Fetch current SPY price from Polygon."""
@@ -373,9 +629,9 @@ class GEXEngine:
             url = "https://api.polygon.io/v2/aggs/ticker/SPY/prev"
             params = {"apiKey": self.api_key}
 
-            resp = requests.get(url, params=params, timeout=10)
+            resp = self._session.get(url, params=params, timeout=10)
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content) if HAS_ORJSON else resp.json()
                 results = data.get("results", [])
                 if results:
                     return results[0].get("c", 0)  # Close price
@@ -384,46 +640,68 @@ class GEXEngine:
             log.error(f"Spot price fetch error: {e}")
             return 0.0
 
-    def _fetch_options_chain(self) -> tuple:
-        """Fetch SPY options chain from Polygon. Returns (options_list, spot_price)."""
-        if not HAS_REQUESTS or not self.api_key:
-            log.warning("No requests library or API key for options chain")
-            return [], 0.0
+    def _fetch_chain_side(self, contract_type: str) -> List[dict]:
+        """Fetch every page of today's SPY chain for one contract type."""
+        today = datetime.now().strftime("%Y-%m-%d")
 
-        try:
-            # Get spot price first
-            spot_price = self._fetch_spot_price()
+        url = "https://api.polygon.io/v3/snapshot/options/SPY"
+        params = {
+            "apiKey": self.api_key,
+            "expiration_date": today,  # 0DTE only
+            "contract_type": contract_type,
+            "limit": 250
+        }
 
-            # Get 0DTE options
-            today = datetime.now().strftime("%Y-%m-%d")
+        results = []
+
+        resp = self._session.get(url, params=params, timeout=15)
+        if resp.status_code == 200:
+            data = orjson.loads(resp.content) if HAS_ORJSON else resp.json()
+            results.extend(data.get("results", []))
+
+            # Handle pagination (cursor-based, so pages within a side stay sequential)
+            next_url = data.get("next_url")
+            while next_url:
+                resp = self._session.get(f"{next_url}&apiKey={self.api_key}", timeout=15)
+                if resp.status_code == 200:
+                    data = orjson.loads(resp.content) if HAS_ORJSON else resp.json()
+                    results.extend(data.get("results", []))
+                    next_url = data.get("next_url")
+                else:
+                    break
+        else:
+            log.warning(f"Options chain fetch failed ({contract_type}): {resp.status_code}")
 
-            url = "https://api.polygon.io/v3/snapshot/options/SPY"
-            params = {
-                "apiKey": self.api_key,
-                "expiration_date": today,  # 0DTE only
-                "limit": 250
-            }
+        return results
 
-            all_results = []
+    def _fetch_options_chain(self, force: bool = False) -> tuple:
+        """
+        Fetch SPY options chain from Polygon. Returns (options_list, spot_price).
+        A chain fetched within 80% of the current refresh interval is reused unless force=True.
+        """
+        if not force and self._chain_cache is not None:
+            fetched_at, cached_options, cached_spot = self._chain_cache
+            if monotonic() - fetched_at < self.refresh_interval.value * 0.8:
+                return cached_options, cached_spot
 
-            resp = requests.get(url, params=params, timeout=15)
-            if resp.status_code == 200:
-                data = resp.json()
-                all_results.extend(data.get("results", []))
-
-                # Handle pagination
-                next_url = data.get("next_url")
-                while next_url:
-                    resp = requests.get(f"{next_url}&apiKey={self.api_key}", timeout=15)
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        all_results.extend(data.get("results", []))
-                        next_url = data.get("next_url")
-                    else:
-                        break
-            else:
-                log.warning(f"Options chain fetch failed: {resp.status_code}")
+        if not HAS_REQUESTS or not self.api_key:
+            log.warning("No requests library or API key for options chain")
+            return [], 0.0
 
+        try:
+            # Spot, calls and puts are independent requests; GEX sums commute,
+            # so fetch them concurrently and concatenate.
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix="gex-fetch") as pool:
+                spot_future = pool.submit(self._fetch_spot_price)
+                side_futures = [pool.submit(self._fetch_chain_side, side) for side in ("call", "put")]
+
+                all_results = []
+                for future in side_futures:
+                    all_results.extend(future.result())
+                spot_price = spot_future.result()
+
+            if all_results and spot_price > 0:
+                self._chain_cache = (monotonic(), all_results, spot_price)
             return all_results, spot_price
 
         except Exception as e:
@@ -436,68 +714,93 @@ class GEXEngine:
         greeks = raw.get("greeks", {})
         underlying = raw.get("underlying_asset", {})
 
+        contract_type = details.get("contract_type", "")
+
         return {
             "strike": details.get("strike_price", 0),
-            "contract_type": details.get("contract_type", ""),
+            "contract_type": contract_type,
+            "direction": CONTRACT_DIRECTION.get(contract_type, -1),
             "expiration": details.get("expiration_date", ""),
             "open_interest": raw.get("open_interest", 0),
             "gamma": greeks.get("gamma", 0),
             "delta": greeks.get("delta", 0),
             "theta": greeks.get("theta", 0),
             "vega": greeks.get("vega", 0),
-            "iv": raw.get("implied_volatility", 0.3),
+            "iv": raw.get("implied_volatility", math.nan),  # missing IV -> no charm/vanna
             "underlying_price": underlying.get("price", 0),
         }
 
-    def calculate(self) -> GEXSnapshot:
+    def _parse_chain(self, raw_options: List[dict]) -> Dict[str, Any]:
         """
-        Calculate complete GEX snapshot.
-        This is the main method called by the background loop.
+        Parse Polygon option snapshots straight into column arrays (SoA).
+        Rows without a strike or open interest are dropped here, so no per-option
+        dict is built for them and every downstream array holds valid rows only.
         """
-        timestamp = datetime.now(timezone.utc).isoformat()
+        strike, open_interest, gamma, vega, iv, direction = [], [], [], [], [], []
 
-        # Fetch options chain and spot price
-        raw_options, spot_price = self._fetch_options_chain()
+        for raw in raw_options:
+            details = raw.get("details", {})
+            k = details.get("strike_price", 0)
+            oi = raw.get("open_interest", 0)
+            if k <= 0 or oi <= 0:
+                continue
 
-        if not raw_options or spot_price <= 0:
-            # Return empty snapshot if no data
-            log.warning("No options data available for GEX calculation")
-            return GEXSnapshot(
-                timestamp=timestamp,
-                spot_price=0,
-                total_gex=0,
-                call_gex=0,
-                put_gex=0,
-                flip_point=None,
-                flip_distance_pct=1.0,
-                regime=GEXRegime.UNKNOWN.value,
-                charm_flow_per_hour=0,
-                vanna_exposure=0,
-                key_support=[],
-                key_resistance=[],
-                magnets=[],
-                refresh_interval_seconds=300,
-                options_count=0
+            greeks = raw.get("greeks", {})
+            strike.append(k)
+            open_interest.append(oi)
+            gamma.append(greeks.get("gamma", 0))
+            vega.append(greeks.get("vega", 0))
+            iv.append(raw.get("implied_volatility", np.nan))
+            # +1 call / -1 put: the dealer-positioning sign used directly in every formula
+            direction.append(CONTRACT_DIRECTION.get(details.get("contract_type", ""), -1))
+
+        return {
+            "strike": np.array(strike, dtype=np.float64),
+            "open_interest": np.array(open_interest, dtype=np.float64),
+            "gamma": np.array(gamma, dtype=np.float64),
+            "vega": np.array(vega, dtype=np.float64),
+            "iv": np.array(iv, dtype=np.float64),
+            "direction": np.array(direction, dtype=np.int8),
+        }
+
+    def _aggregate_chain(self, chain: Dict[str, Any], spot_price: float, tau: float) -> tuple:
+        """
+        Vectorized GEX/charm/vanna aggregation over the parsed (pre-filtered) chain.
+        Returns (total_gex, call_gex, put_gex, total_charm, total_vanna, gex_by_strike).
+        """
+        unique_strikes, inverse = np.unique(chain["strike"], return_inverse=True)
+
+        if HAS_GEX_KERNEL:
+            *totals, per_strike = gex_kernel(
+                chain["strike"], chain["open_interest"], chain["gamma"], chain["vega"],
+                chain["iv"], chain["direction"], inverse, len(unique_strikes),
+                float(spot_price), float(tau)
             )
+        else:
+            *totals, gex = _chain_totals(chain, spot_price, tau)
+            per_strike = np.bincount(inverse, weights=gex, minlength=len(unique_strikes))
 
-        options = [self._parse_option(o) for o in raw_options]
+        return (
+            *(float(total) for total in totals),
+            dict(zip(unique_strikes.tolist(), per_strike.tolist())),
+        )
 
-        # Calculate GEX for each strike
+    def _aggregate_options(self, options: List[dict], spot_price: float, tau: float) -> tuple:
+        """Per-option fallback for _aggregate_chain when NumPy is unavailable."""
         total_gex = 0
         call_gex = 0
         put_gex = 0
         gex_by_strike: Dict[float, float] = {}
-
         total_charm = 0
         total_vanna = 0
-
-        tau = get_time_to_expiry_years()
+        sqrt_tau = math.sqrt(tau) if tau > 0 else 0.0
 
         for opt in options:
             if opt["strike"] <= 0 or opt["open_interest"] <= 0:
                 continue
 
-            is_call = opt["contract_type"] == "call"
+            direction = opt["direction"]
+            is_call = direction > 0
 
             # Calculate GEX
             strike_gex = calculate_gex_per_strike(
@@ -517,26 +820,61 @@ class GEXEngine:
             strike = opt["strike"]
             gex_by_strike[strike] = gex_by_strike.get(strike, 0) + strike_gex
 
-            # Calculate charm
-            charm = calculate_charm(
+            # Calculate charm and vanna from one d1
+            charm, vanna = _greeks_combined(
                 gamma=opt["gamma"],
+                vega=opt["vega"],
                 iv=opt["iv"],
                 spot=spot_price,
                 strike=strike,
-                time_to_expiry_years=tau
+                tau=tau,
+                sqrt_tau=sqrt_tau
             )
-            direction = 1 if is_call else -1
             total_charm += charm * opt["open_interest"] * 100 * direction
+            total_vanna += vanna * opt["open_interest"] * 100 * direction
 
-            # Calculate vanna
-            vanna = calculate_vanna(
-                vega=opt["vega"],
-                spot=spot_price,
-                strike=strike,
-                iv=opt["iv"],
-                time_to_expiry_years=tau
+        return total_gex, call_gex, put_gex, total_charm, total_vanna, gex_by_strike
+
+    def calculate(self, force: bool = False) -> GEXSnapshot:
+        """
+        Calculate complete GEX snapshot.
+        This is the main method called by the background loop.
+        force=True bypasses the short-lived options chain cache.
+        """
+        timestamp = datetime.now(timezone.utc).isoformat()
+
+        # Fetch options chain and spot price
+        raw_options, spot_price = self._fetch_options_chain(force=force)
+
+        if not raw_options or spot_price <= 0:
+            # Return empty snapshot if no data
+            log.warning("No options data available for GEX calculation")
+            return GEXSnapshot(
+                timestamp=timestamp,
+                spot_price=0,
+                total_gex=0,
+                call_gex=0,
+                put_gex=0,
+                flip_point=None,
+                flip_distance_pct=1.0,
+                regime=GEXRegime.UNKNOWN.value,
+                charm_flow_per_hour=0,
+                vanna_exposure=0,
+                key_support=[],
+                key_resistance=[],
+                magnets=[],
+                refresh_interval_seconds=300,
+                options_count=0
             )
-            total_vanna += vanna * opt["open_interest"] * 100 * direction
+
+        tau = get_time_to_expiry_years()
+
+        # Calculate GEX, charm and vanna across the chain
+        if HAS_NUMPY:
+            aggregate = self._aggregate_chain(self._parse_chain(raw_options), spot_price, tau)
+        else:
+            aggregate = self._aggregate_options([self._parse_option(o) for o in raw_options], spot_price, tau)
+        total_gex, call_gex, put_gex, total_charm, total_vanna, gex_by_strike = aggregate
 
         # Find gamma flip point
         flip_point = find_gamma_flip_point(gex_by_strike, spot_price)
@@ -570,20 +908,20 @@ class GEXEngine:
 
         snapshot = GEXSnapshot(
             timestamp=timestamp,
-            spot_price=round(spot_price, 2),
-            total_gex=round(total_gex, 0),
-            call_gex=round(call_gex, 0),
-            put_gex=round(put_gex, 0),
-            flip_point=round(flip_point, 2) if flip_point else None,
-            flip_distance_pct=round(flip_distance_pct, 4),
+            spot_price=spot_price,
+            total_gex=total_gex,
+            call_gex=call_gex,
+            put_gex=put_gex,
+            flip_point=flip_point,
+            flip_distance_pct=flip_distance_pct,
             regime=regime.value,
-            charm_flow_per_hour=round(charm_per_hour, 0),
-            vanna_exposure=round(total_vanna, 0),
+            charm_flow_per_hour=charm_per_hour,
+            vanna_exposure=total_vanna,
             key_support=levels["support"],
             key_resistance=levels["resistance"],
             magnets=levels["magnets"],
             refresh_interval_seconds=self.refresh_interval.value,
-            options_count=len(options)
+            options_count=len(raw_options)
         )
 
         # Log summary
@@ -591,27 +929,34 @@ class GEXEngine:
         log.info(
             f"GEX: {total_gex/1e9:.2f}B | Regime: {regime.value} | "
             f"Flip: {flip_str} ({flip_distance_pct*100:.1f}% away) | "
-            f"Options: {len(options)}"
+            f"Options: {len(raw_options)}"
         )
 
         # Save to history
         self._save_to_history(snapshot)
         self.last_snapshot = snapshot
         self.last_update = datetime.now(timezone.utc)
+        self._last_update_monotonic = monotonic()
 
         return snapshot
 
+    async def calculate_async(self, force: bool = False) -> GEXSnapshot:
+        """
+        Async variant of calculate() for event-loop callers.
+        The blocking Polygon fetch and aggregation run in a worker thread.
+        """
+        return await asyncio.to_thread(self.calculate, force)
+
     def get_last_snapshot(self) -> Optional[GEXSnapshot]:
         """Get the most recent GEX snapshot."""
         return self.last_snapshot
 
     def should_refresh(self) -> bool:
         """Check if GEX should be recalculated."""
-        if self.last_update is None:
+        if self._last_update_monotonic is None:
             return True
 
-        elapsed = (datetime.now(timezone.utc) - self.last_update).total_seconds()
-        return elapsed >= self.refresh_interval.value
+        return monotonic() - self._last_update_monotonic >= self.refresh_interval.value
 
     def get_conviction_modifier(self, trade_direction: str) -> dict:
         """
@@ -34,14 +34,20 @@ DISCLAIMER:
 import os
 import time
 import json
+import asyncio
 import math
+import bisect
+import heapq
 import logging
 import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
-from collections import deque
+from typing import Callable, Optional
+from collections import deque, defaultdict
+from itertools import islice
 
 # ─────────────────────────────────────────────────────────────────────
 # Alpaca SDK imports
@@ -75,11 +81,25 @@ except ImportError:
 
 try:
     import requests as req
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
     print("[WARN] requests not installed. External data feeds disabled.")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
 # ─────────────────────────────────────────────────────────────────────
 # Configuration
 # ─────────────────────────────────────────────────────────────────────
@@ -94,6 +114,38 @@ PAPER = True  # Always paper trading
 API_KEY = os.environ.get("ALPACA_API_KEY", "")
 API_SECRET = os.environ.get("ALPACA_SECRET_KEY", "")
 
+# Live BTC funding from the Binance mark-price stream; set to "false" to poll REST only
+BINANCE_WS_ENABLED = os.environ.get("HYDRA_BINANCE_WS", "true").lower() == "true"
+BINANCE_WS_URL = "wss://fstream.binance.com/stream?streams=btcusdt@markPrice"
+BINANCE_WS_MAX_AGE = 30.0  # seconds before a silent stream falls back to REST
+
+# Alpaca real-time quotes wake the run loop; set to "false" to cycle on the timer only
+ALPACA_STREAM_ENABLED = os.environ.get("HYDRA_ALPACA_STREAM", "true").lower() == "true"
+ALPACA_STOCK_STREAM_URL = "wss://stream.data.alpaca.markets/v2/iex"
+ALPACA_CRYPTO_STREAM_URL = "wss://stream.data.alpaca.markets/v1beta3/crypto/us"
+ALPACA_STREAM_MAX_AGE = 30.0  # seconds before a streamed quote is re-fetched over REST
+# Minimum spacing of tick-driven cycles. Unset means the run interval: quotes then
+# only refresh prices between cycles, keeping the bar cadence the regime windows,
+# ratio history, per-cycle order cap and weight-update period are tuned for.
+_min_cycle_env = os.environ.get("HYDRA_MIN_CYCLE_SECONDS")
+MIN_CYCLE_SECONDS: Optional[float] = float(_min_cycle_env) if _min_cycle_env else None
+
+
+@dataclass(frozen=True, slots=True)
+class TickContext:
+    """
+    One clock reading shared by everything that handles a market event, so
+    regime, signal and risk code agree on "now" and replays can drive it
+    from the tape. Methods that accept ctx read the wall clock when it is None.
+    """
+    now: datetime
+    now_ts: float   # now as a POSIX timestamp
+
+    @classmethod
+    def capture(cls) -> "TickContext":
+        now = datetime.now(timezone.utc)
+        return cls(now=now, now_ts=now.timestamp())
+
 # ═════════════════════════════════════════════════════════════════════
 #  SECTION 1: MARKET REGIME DETECTION
 #  ─────────────────────────────────────────────────────────────────
@@ -113,7 +165,7 @@ class Regime(Enum):
     UNKNOWN = "unknown"                  # Observation mode, no trading
 
 
-@dataclass
+@dataclass(slots=True)
 class RegimeState:
     """Current detected regime with confidence score."""
     regime: Regime = Regime.UNKNOWN
@@ -126,6 +178,93 @@ class RegimeState:
     cross_asset_stress: float = 0.0    # 0 = calm, 1 = everything correlated in selloff
 
 
+class RingBuffer:
+    """
+    Fixed-capacity history of floats, oldest first.
+
+    With NumPy the values live in a preallocated array and each push is
+    written twice (at head and head + capacity), so tail(k) is always a
+    contiguous float64 view: no boxing per value and no copy per read.
+    Without NumPy it falls back to a deque and tail(k) returns a list.
+    """
+
+    def __init__(self, capacity: int, dtype=None):
+        self.capacity = capacity
+        if NUMPY_AVAILABLE:
+            self._buf = np.zeros(2 * capacity, dtype=dtype or np.float64)
+            self._head = 0
+            self._count = 0
+        else:
+            self._buf = deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        return self._count if NUMPY_AVAILABLE else len(self._buf)
+
+    def push(self, value: float):
+        if NUMPY_AVAILABLE:
+            self._buf[self._head] = value
+            self._buf[self._head + self.capacity] = value
+            self._head = (self._head + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+        else:
+            self._buf.append(value)
+
+    def tail(self, k: int):
+        """Latest k values (fewer if not yet filled), oldest first."""
+        if NUMPY_AVAILABLE:
+            end = self._head + self.capacity
+            return self._buf[end - min(k, self._count):end]
+        # Walk back k items rather than copying the whole deque
+        return list(islice(reversed(self._buf), k))[::-1]
+
+    def oldest(self) -> float:
+        """Oldest value still in the window (the next one a full buffer evicts)."""
+        if NUMPY_AVAILABLE:
+            return float(self._buf[self._head + self.capacity - self._count])
+        return self._buf[0]
+
+
+# Rolling SPY window kept by RegimeDetector
+PRICE_WINDOW = 500
+
+# Incremental window statistics are re-reduced from scratch this often
+RATIO_RESYNC_EVERY = 1000
+
+# Integer codes used by RegimeDetector.classify_batch: REGIME_ORDER[code] -> Regime
+REGIME_ORDER = tuple(Regime)
+REGIME_CODE = {regime: code for code, regime in enumerate(REGIME_ORDER)}
+
+# Strategies stay idle while the detected regime is less certain than this
+MIN_REGIME_CONFIDENCE = 0.4
+
+# VIX fear score: VIX below VIX_EDGES[i] scores VIX_SCORES[i]; 35+ scores 1.0
+VIX_EDGES = (12, 16, 20, 25, 35)
+VIX_SCORES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+if NUMPY_AVAILABLE:
+    VIX_EDGE_ARRAY = np.array(VIX_EDGES, dtype=np.float64)
+    VIX_SCORE_ARRAY = np.array(VIX_SCORES)
+
+    # Trend score: momentum over the last 5/20/50 bars, short-term weighted most
+    MOMENTUM_LAG_INDEX = np.array([-5, -20, -50])
+    MOMENTUM_WEIGHTS = np.array([0.5, 0.3, 0.2])
+
+
+# Prefer the ahead-of-time build (python _build_hydra_kernels.py), then the JIT kernels
+try:
+    from _hydra_kernels_aot import (
+        autocorr_mr as _autocorr_mr, trend_mr as _update_kernel,
+        rolling_std as _rolling_std_welford, window_mean_m2 as _window_mean_m2
+    )
+    KERNELS_COMPILED = True
+except ImportError:
+    from _hydra_kernels import (
+        autocorr_mr as _autocorr_mr, trend_mr as _update_kernel,
+        rolling_std as _rolling_std_welford, window_mean_m2 as _window_mean_m2,
+        HAS_NUMBA as KERNELS_COMPILED
+    )
+
+
 class RegimeDetector:
     """
     Detects market regime using multiple signals.
@@ -142,22 +281,26 @@ class RegimeDetector:
     """
 
     def __init__(self):
-        self.price_history = deque(maxlen=500)  # Rolling window of SPY prices
-        self.vix_history = deque(maxlen=100)
+        self.price_history = RingBuffer(PRICE_WINDOW)  # Rolling window of SPY prices
+        self.vix_history = RingBuffer(100)
         self.current_state = RegimeState()
         self.regime_history = deque(maxlen=50)
+        self._last_regime: Regime = Regime.UNKNOWN  # regime_history[-1].regime, kept flat for _classify
 
     def update(self, spy_price: float, vix: float, vix_3m: float = 0,
-               hyg_price: float = 0, btc_price: float = 0):
+               hyg_price: float = 0, btc_price: float = 0,
+               ctx: Optional[TickContext] = None):
         """Ingest new data and re-evaluate regime."""
-        self.price_history.append(spy_price)
-        self.vix_history.append(vix)
+        now = ctx.now if ctx is not None else datetime.now(timezone.utc)
+        self.price_history.push(spy_price)
+        self.vix_history.push(vix)
 
         if len(self.price_history) < 20:
-            self.current_state = RegimeState(regime=Regime.UNKNOWN, confidence=0.0)
+            self.current_state = RegimeState(regime=Regime.UNKNOWN, confidence=0.0, detected_at=now)
             return self.current_state
 
-        prices = list(self.price_history)
+        # Trend looks back 50 bars and mean reversion 31; nothing older is read
+        prices = self.price_history.tail(50)
 
         # ── Signal 1: VIX Level ──
         vix_signal = self._score_vix(vix)
@@ -166,11 +309,15 @@ class RegimeDetector:
         term_slope = (vix_3m - vix) if vix_3m > 0 else 0
         # Positive = contango (normal), Negative = backwardation (panic)
 
-        # ── Signal 3: Trend Strength ──
-        trend = self._calc_trend_strength(prices)
+        if KERNELS_COMPILED:
+            # ── Signals 3 + 4: Trend Strength and Mean Reversion, one compiled pass ──
+            trend, mr_score = _update_kernel(prices)
+        else:
+            # ── Signal 3: Trend Strength ──
+            trend = self._calc_trend_strength(prices)
 
-        # ── Signal 4: Mean Reversion Score ──
-        mr_score = self._calc_mean_reversion(prices)
+            # ── Signal 4: Mean Reversion Score ──
+            mr_score = self._calc_mean_reversion(prices)
 
         # ── Signal 5: Determine Regime ──
         regime, confidence = self._classify(vix, vix_signal, term_slope, trend, mr_score)
@@ -181,21 +328,43 @@ class RegimeDetector:
             vix_level=vix,
             vix_term_slope=term_slope,
             trend_strength=trend,
-            mean_reversion_score=mr_score
+            mean_reversion_score=mr_score,
+            detected_at=now
         )
         self.regime_history.append(self.current_state)
+        self._last_regime = regime
         return self.current_state
 
-    def _score_vix(self, vix: float) -> float:
-        """Score VIX on a 0-1 scale where 1 = extreme fear."""
-        if vix < 12: return 0.0
-        if vix < 16: return 0.2
-        if vix < 20: return 0.4
-        if vix < 25: return 0.6
-        if vix < 35: return 0.8
-        return 1.0
+    def realized_vol(self, window: int = 20) -> float:
+        """
+        Sample std of simple returns over the last `window` SPY prices
+        (per bar, not annualized); 0.0 until there are enough prices.
+        """
+        if not NUMPY_AVAILABLE:
+            prices = list(self.price_history.tail(window))
+            returns = [(b - a) / a for a, b in zip(prices, prices[1:]) if a != 0]
+            if len(returns) < 2:
+                return 0.0
+            mean = sum(returns) / len(returns)
+            return math.sqrt(sum((r - mean) ** 2 for r in returns) / (len(returns) - 1))
+
+        prices = self.price_history.tail(window)
+        prev = prices[:-1]
+        valid = prev != 0
+        returns = np.ascontiguousarray((prices[1:][valid] - prev[valid]) / prev[valid])
+        return float(_rolling_std_welford(returns))
+
+    def _score_vix(self, vix):
+        """
+        Score VIX on a 0-1 scale where 1 = extreme fear.
+        Branch-free table lookup; an ndarray of VIX values is scored element-wise.
+        """
+        if NUMPY_AVAILABLE:
+            scores = VIX_SCORE_ARRAY[np.searchsorted(VIX_EDGE_ARRAY, vix, side="right")]
+            return scores if isinstance(vix, np.ndarray) else float(scores)
+        return VIX_SCORES[bisect.bisect_right(VIX_EDGES, vix)]
 
-    def _calc_trend_strength(self, prices: list) -> float:
+    def _calc_trend_strength(self, prices) -> float:
         """
         Modified ADX calculation using price momentum over multiple timeframes.
         Returns -1 (strong downtrend) to +1 (strong uptrend). Near 0 = range-bound.
@@ -203,6 +372,14 @@ class RegimeDetector:
         if len(prices) < 50:
             return 0.0
 
+        if NUMPY_AVAILABLE:
+            # One gather of the -5/-20/-50 prices, then all three momenta at once
+            lagged = prices[MOMENTUM_LAG_INDEX]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                momentum = np.where(lagged != 0, (prices[-1] - lagged) / lagged, 0.0)
+            raw = float(momentum @ MOMENTUM_WEIGHTS) * 100
+            return max(-1.0, min(1.0, raw / 5.0))
+
         # Short-term momentum (5 bars)
         short_mom = (prices[-1] - prices[-5]) / prices[-5] if prices[-5] != 0 else 0
 
@@ -218,7 +395,7 @@ class RegimeDetector:
         # Clamp to -1 to +1
         return max(-1.0, min(1.0, raw / 5.0))
 
-    def _calc_mean_reversion(self, prices: list) -> float:
+    def _calc_mean_reversion(self, prices) -> float:
         """
         Calculate how mean-reverting recent price action is.
         Uses autocorrelation of returns - negative autocorrelation = mean-reverting.
@@ -227,28 +404,8 @@ class RegimeDetector:
         if len(prices) < 30:
             return 0.5
 
-        # Calculate returns
-        returns = [(prices[i] - prices[i-1]) / prices[i-1]
-                   for i in range(max(1, len(prices)-30), len(prices))
-                   if prices[i-1] != 0]
-
-        if len(returns) < 10:
-            return 0.5
-
-        # Lag-1 autocorrelation of returns
-        mean_r = sum(returns) / len(returns)
-        var = sum((r - mean_r)**2 for r in returns)
-        if var == 0:
-            return 0.5
-
-        cov = sum((returns[i] - mean_r) * (returns[i-1] - mean_r)
-                  for i in range(1, len(returns)))
-
-        autocorr = cov / var if var != 0 else 0
-
-        # Negative autocorrelation = mean reverting
-        # Map from [-1, 1] to [0, 1] where 1 = strongly mean-reverting
-        return max(0.0, min(1.0, 0.5 - autocorr))
+        # Last 30 returns need the last 31 prices
+        return _autocorr_mr(prices[-31:])
 
     def _classify(self, vix, vix_signal, term_slope, trend, mr_score):
         """
@@ -272,10 +429,9 @@ class RegimeDetector:
             return Regime.TRENDING_DOWN, abs(trend)
 
         # ── RECOVERY ──
-        if trend > 0.1 and vix > 18 and len(self.regime_history) > 0:
-            last = self.regime_history[-1]
-            if last.regime in (Regime.CRASH, Regime.HIGH_VOL_EXPANSION):
-                return Regime.RECOVERY, 0.6
+        if trend > 0.1 and vix > 18 and (self._last_regime is Regime.CRASH
+                                         or self._last_regime is Regime.HIGH_VOL_EXPANSION):
+            return Regime.RECOVERY, 0.6
 
         # ── MEAN REVERTING ──
         if mr_score > 0.55 and vix < 22:
@@ -283,6 +439,120 @@ class RegimeDetector:
 
         return Regime.UNKNOWN, 0.3
 
+    def classify_batch(self, vix, term_slope, trend, mr_score, prev_regime: Optional[Regime] = None):
+        """
+        Vectorized _classify over N ticks (NumPy required), for offline relabeling.
+
+        All inputs are length-N arrays. prev_regime is the regime before the
+        first tick (None = no history). RECOVERY only needs to know whether the
+        previous tick was CRASH or HIGH_VOL_EXPANSION, and those two branches
+        never depend on history, so the lag is a one-element shift.
+
+        Returns (codes, confidence): int8 codes into REGIME_ORDER and float64.
+        """
+        vix = np.asarray(vix, dtype=np.float64)
+        term_slope = np.asarray(term_slope, dtype=np.float64)
+        trend = np.asarray(trend, dtype=np.float64)
+        mr_score = np.asarray(mr_score, dtype=np.float64)
+        vix_signal = self._score_vix(vix)
+
+        crash = (vix > 30) & (term_slope < -2) & (trend < -0.5)
+        high_vol = (vix > 22) & (term_slope < 0)
+        stressed = crash | high_vol
+        prev_stressed = np.empty_like(stressed)
+        prev_stressed[0] = prev_regime in (Regime.CRASH, Regime.HIGH_VOL_EXPANSION)
+        prev_stressed[1:] = stressed[:-1]
+
+        conditions = [
+            crash,
+            high_vol,
+            (trend > 0.3) & (mr_score < 0.4),
+            (trend < -0.3) & (mr_score < 0.4),
+            (trend > 0.1) & (vix > 18) & prev_stressed,
+            (mr_score > 0.55) & (vix < 22),
+        ]
+        codes = np.select(conditions, [
+            REGIME_CODE[Regime.CRASH],
+            REGIME_CODE[Regime.HIGH_VOL_EXPANSION],
+            REGIME_CODE[Regime.TRENDING_UP],
+            REGIME_CODE[Regime.TRENDING_DOWN],
+            REGIME_CODE[Regime.RECOVERY],
+            REGIME_CODE[Regime.MEAN_REVERTING],
+        ], default=REGIME_CODE[Regime.UNKNOWN]).astype(np.int8)
+        confidence = np.select(conditions, [
+            np.minimum(1.0, vix_signal + 0.2),
+            0.6 + vix_signal * 0.3,
+            np.abs(trend),
+            np.abs(trend),
+            0.6,
+            mr_score,
+        ], default=0.3)
+        return codes, confidence
+
+    @staticmethod
+    def _bulk_trend(p):
+        """bulk_update trend: -5/-20/-50 bar momentum from tick 49 on."""
+        n = len(p)
+        trend = np.zeros(n)
+        if n >= 50:
+            last = p[49:]
+            raw = np.zeros(n - 49)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                for lag, weight in zip((4, 19, 49), MOMENTUM_WEIGHTS):
+                    lagged = p[49 - lag:n - lag]
+                    raw += np.where(lagged != 0, (last - lagged) / lagged, 0.0) * weight
+            trend[49:] = np.clip(raw * 100 / 5.0, -1.0, 1.0)
+        return trend
+
+    @staticmethod
+    def _bulk_mr_score(p):
+        """bulk_update mean reversion: lag-1 autocorrelation of the last 30 returns."""
+        n = len(p)
+        mr_score = np.full(n, 0.5)
+        if n >= 30:
+            # Tick 29 sees only 30 prices (29 returns)
+            mr_score[29] = _autocorr_mr(p[:30])
+        if n >= 31:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                returns = np.where(p[:-1] != 0, np.diff(p) / p[:-1], np.nan)
+            windows = np.lib.stride_tricks.sliding_window_view(returns, 30)  # row j ends at tick 30 + j
+            dev = windows - windows.mean(axis=1, keepdims=True)
+            var = np.einsum("ij,ij->i", dev, dev)
+            cov = np.einsum("ij,ij->i", dev[:, :-1], dev[:, 1:])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mr = np.where(var == 0, 0.5, np.clip(0.5 - cov / var, 0.0, 1.0))
+            # Windows spanning a zero price skip that return; rare, so score them exactly
+            for j in np.flatnonzero(np.isnan(var)):
+                mr[j] = _autocorr_mr(p[j:j + 31])
+            mr_score[30:] = mr
+        return mr_score
+
+    def bulk_update(self, spy_prices, vix, vix_3m=None):
+        """
+        Regime codes for a whole price/VIX series (NumPy required), as if each
+        tick had been fed through update() on a fresh detector. Detector state
+        is not touched; use it for calibration and end-of-day relabeling.
+
+        Returns int8 codes into REGIME_ORDER, one per tick (UNKNOWN until 20 prices).
+        """
+        p = np.ascontiguousarray(spy_prices, dtype=np.float64)
+        vix = np.asarray(vix, dtype=np.float64)
+        n = len(p)
+        codes = np.full(n, REGIME_CODE[Regime.UNKNOWN], dtype=np.int8)
+        if n < 20:
+            return codes
+
+        if vix_3m is None:
+            term_slope = np.zeros(n)
+        else:
+            vix_3m = np.asarray(vix_3m, dtype=np.float64)
+            term_slope = np.where(vix_3m > 0, vix_3m - vix, 0.0)
+
+        trend = self._bulk_trend(p)
+        mr_score = self._bulk_mr_score(p)
+        codes[19:], _ = self.classify_batch(vix[19:], term_slope[19:], trend[19:], mr_score[19:])
+        return codes
+
 
 # ═════════════════════════════════════════════════════════════════════
 #  SECTION 2: SIGNAL PROCESSING ENGINE
@@ -293,7 +563,7 @@ class RegimeDetector:
 #  treating market data like radio signals to be decoded.
 # ═════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """A single trading signal from any source."""
     name: str
@@ -305,16 +575,70 @@ class Signal:
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     ttl_minutes: int = 60         # Signal expires after this many minutes
     metadata: dict = field(default_factory=dict)
+    _dead: bool = field(default=False, init=False, repr=False, compare=False)  # evicted by SignalAggregator
+    _expiry_ts: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # POSIX expiry computed once; expiry checks are then a float compare
+        self._expiry_ts = self.timestamp.timestamp() + self.ttl_minutes * 60
 
     @property
     def composite_score(self) -> float:
         """Direction * strength = composite score."""
         return self.direction * self.strength
 
+    def is_expired_at(self, now_ts: float) -> bool:
+        """Expiry check against a POSIX time read once per sweep (time.time())."""
+        return now_ts > self._expiry_ts
+
     @property
     def is_expired(self) -> bool:
-        now = datetime.now(timezone.utc)
-        return (now - self.timestamp).total_seconds() > self.ttl_minutes * 60
+        return self.is_expired_at(time.time())
+
+
+class _SignalBucket:
+    """
+    One asset's live signals in insertion order. With NumPy, the inputs to
+    get_composite are mirrored as parallel arrays (SoA) filled at insert time,
+    so scoring a bucket is a handful of array ops instead of a per-signal loop.
+    """
+
+    COLUMNS = ("direction", "strength", "source_weight", "timestamp", "ttl_minutes")
+
+    def __init__(self, capacity: int = 16):
+        self.signals: list[Signal] = []
+        if NUMPY_AVAILABLE:
+            for column in self.COLUMNS:
+                setattr(self, column, np.empty(capacity, dtype=np.float64))
+
+    def __len__(self) -> int:
+        return len(self.signals)
+
+    def append(self, signal: Signal, source_weight: float):
+        if NUMPY_AVAILABLE:
+            n = len(self.signals)
+            if n == len(self.direction):
+                for column in self.COLUMNS:
+                    grown = np.empty(2 * n, dtype=np.float64)
+                    grown[:n] = getattr(self, column)
+                    setattr(self, column, grown)
+            self.direction[n] = signal.direction
+            self.strength[n] = signal.strength
+            self.source_weight[n] = source_weight
+            self.timestamp[n] = signal.timestamp.timestamp()
+            self.ttl_minutes[n] = signal.ttl_minutes
+        self.signals.append(signal)
+
+    def prune(self):
+        """Drop signals the aggregator has marked dead, keeping order."""
+        if NUMPY_AVAILABLE:
+            n = len(self.signals)
+            keep = np.fromiter((not s._dead for s in self.signals), dtype=bool, count=n)
+            kept = int(keep.sum())
+            for column in self.COLUMNS:
+                values = getattr(self, column)
+                values[:kept] = values[:n][keep]
+        self.signals = [s for s in self.signals if not s._dead]
 
 
 class SignalAggregator:
@@ -328,7 +652,11 @@ class SignalAggregator:
     """
 
     def __init__(self):
-        self.signals: list[Signal] = []
+        # Live signals are indexed twice: a min-heap on expiry time for eviction,
+        # and per-asset buckets (insertion order) for get_composite lookups.
+        self._expiry_heap: list[tuple[float, int, Signal]] = []
+        self._by_asset: dict[str, _SignalBucket] = defaultdict(_SignalBucket)
+        self._counter = 0
         self.signal_weights = {
             # Source reliability weights based on historical accuracy
             "gex_levels": 0.85,         # Dealer gamma is highly reliable
@@ -345,14 +673,40 @@ class SignalAggregator:
             "candle_structure": 0.50,   # Candlestick patterns alone are weak
         }
 
-    def add_signal(self, signal: Signal):
+    @property
+    def signals(self) -> list[Signal]:
+        """Signals not yet evicted, in no particular order."""
+        return [entry[2] for entry in self._expiry_heap]
+
+    def add_signal(self, signal: Signal, ctx: Optional[TickContext] = None):
         """Add a new signal, removing expired ones."""
-        self.signals = [s for s in self.signals if not s.is_expired]
-        self.signals.append(signal)
+        self._evict_expired(ctx.now_ts if ctx is not None else time.time())
+
+        heapq.heappush(self._expiry_heap, (signal._expiry_ts, self._counter, signal))
+        self._counter += 1
+        source_weight = self.signal_weights.get(signal.source, 0.5)
+        for asset in set(signal.target_assets):
+            self._by_asset[asset].append(signal, source_weight)
+
         log.info(f"Signal: {signal.name} | Dir={signal.direction:+.2f} "
                  f"Str={signal.strength:.2f} | {signal.target_assets}")
 
-    def get_composite(self, asset: str) -> dict:
+    def _evict_expired(self, now_ts: float):
+        """Pop signals whose expiry has passed and drop them from their asset buckets."""
+        heap = self._expiry_heap
+        touched = set()
+        while heap and heap[0][0] < now_ts:
+            signal = heapq.heappop(heap)[2]
+            signal._dead = True
+            touched.update(signal.target_assets)
+
+        for asset in touched:
+            bucket = self._by_asset[asset]
+            bucket.prune()
+            if not bucket:
+                del self._by_asset[asset]
+
+    def get_composite(self, asset: str, ctx: Optional[TickContext] = None) -> dict:
         """
         Get the weighted composite signal for a specific asset.
 
@@ -365,15 +719,21 @@ class SignalAggregator:
                 "signals": list
             }
         """
-        active = [s for s in self.signals
-                  if not s.is_expired and asset in s.target_assets]
+        ctx = ctx if ctx is not None else TickContext.capture()
+        self._evict_expired(ctx.now_ts)
+        bucket = self._by_asset.get(asset)
 
-        if not active:
+        if not bucket:
             return {"direction": 0, "confidence": 0, "signal_count": 0,
                     "dominant_signal": "none", "signals": []}
 
+        if NUMPY_AVAILABLE:
+            return self._composite_arrays(bucket, ctx.now_ts)
+        return self._composite_loop(bucket.signals, ctx.now)
+
+    def _composite_loop(self, active: list[Signal], now: datetime) -> dict:
+        """get_composite over a list of signals, for when NumPy is unavailable."""
         # Time-decay weighting: newer signals weighted more
-        now = datetime.now(timezone.utc)
         weighted_scores = []
         total_weight = 0
 
@@ -401,6 +761,34 @@ class SignalAggregator:
             "signals": [(s.name, s.composite_score) for s in active]
         }
 
+    def _composite_arrays(self, bucket: _SignalBucket, now_ts: float) -> dict:
+        """get_composite over a bucket's SoA columns (same weighting as the loop)."""
+        n = len(bucket)
+        strength = bucket.strength[:n]
+
+        # Time-decay weighting: newer signals weighted more
+        age_minutes = (now_ts - bucket.timestamp[:n]) / 60
+        time_decay = np.maximum(0.1, 1.0 - age_minutes / bucket.ttl_minutes[:n])
+        weight = strength * bucket.source_weight[:n] * time_decay
+        total_weight = float(weight.sum())
+
+        if total_weight == 0:
+            return {"direction": 0, "confidence": 0, "signal_count": 0,
+                    "dominant_signal": "none", "signals": []}
+
+        composite = bucket.direction[:n] * strength
+        direction = float(composite @ weight) / total_weight
+        confidence = min(1.0, total_weight / n)  # More signals = more confident
+        dominant = bucket.signals[int(np.argmax(np.abs(composite)))]
+
+        return {
+            "direction": direction,
+            "confidence": confidence,
+            "signal_count": n,
+            "dominant_signal": dominant.name,
+            "signals": list(zip((s.name for s in bucket.signals), composite.tolist()))
+        }
+
 
 # ═════════════════════════════════════════════════════════════════════
 #  SECTION 3: RISK MANAGEMENT — THE ACTUAL EDGE
@@ -441,16 +829,19 @@ class RiskManager:
         self.daily_pnl = 0.0
         self.daily_start_capital = starting_capital
         self.limits = RiskLimits()
-        self.positions: dict = {}         # asset -> position details
+        self.positions: dict = {}         # asset -> {"notional": summed over open orders, "orders": count}
+        self._total_exposure = 0.0        # sum of position notionals, kept in step with positions
+        self._max_exposure_cap = starting_capital * self.limits.max_total_exposure_pct
         self.trade_log: list = []
         self.consecutive_losses = 0
         self.cooldown_until: Optional[datetime] = None
+        self._cooldown_until_ts = 0.0     # cooldown_until as a POSIX timestamp
         self.daily_trade_count = 0
         self.last_reset_date = datetime.now(timezone.utc).date()
 
-    def _reset_daily(self):
+    def _reset_daily(self, now: datetime):
         """Reset daily counters at market open."""
-        today = datetime.now(timezone.utc).date()
+        today = now.date()
         if today != self.last_reset_date:
             self.daily_pnl = 0.0
             self.daily_start_capital = self.capital
@@ -458,17 +849,38 @@ class RiskManager:
             self.last_reset_date = today
             log.info(f"Daily reset. Capital: ${self.capital:,.2f}")
 
-    def can_trade(self) -> tuple[bool, str]:
+    def _open_position(self, asset: str, notional: float):
+        """Add one order's notional to its asset's position and to total exposure."""
+        pos = self.positions.setdefault(asset, {"notional": 0.0, "orders": 0})
+        pos["notional"] += notional
+        pos["orders"] += 1
+        self._total_exposure += notional
+
+    def _close_position(self, asset: str, notional: float):
+        """Remove one order's notional from its asset's position and from total exposure."""
+        pos = self.positions.get(asset)
+        if pos is None:
+            return
+        pos["orders"] -= 1
+        if pos["orders"] <= 0:
+            del self.positions[asset]
+        else:
+            pos["notional"] -= notional
+        # Re-zero on flat so float drift cannot accumulate across trades
+        self._total_exposure = self._total_exposure - notional if self.positions else 0.0
+
+    def can_trade(self, ctx: Optional[TickContext] = None) -> tuple[bool, str]:
         """Check if trading is allowed right now."""
-        self._reset_daily()
+        ctx = ctx if ctx is not None else TickContext.capture()
+        self._reset_daily(ctx.now)
 
         # Kill switch: daily loss limit
         if self.daily_pnl <= -(self.daily_start_capital * self.limits.max_daily_loss_pct):
             return False, f"KILL SWITCH: Daily loss {self.daily_pnl:,.2f} exceeds limit"
 
         # Cooldown after consecutive losses
-        if self.cooldown_until and datetime.now(timezone.utc) < self.cooldown_until:
-            remaining = (self.cooldown_until - datetime.now(timezone.utc)).seconds // 60
+        if ctx.now_ts < self._cooldown_until_ts:
+            remaining = int(self._cooldown_until_ts - ctx.now_ts) // 60
             return False, f"COOLDOWN: {remaining}min remaining after {self.limits.max_consecutive_losses} consecutive losses"
 
         # Daily trade limit
@@ -477,28 +889,17 @@ class RiskManager:
 
         return True, "OK"
 
-    def calculate_position_size(self, asset: str, entry_price: float,
-                                stop_price: float, volatility: float,
-                                signal_confidence: float) -> dict:
+    @staticmethod
+    def _size_math(capital, entry_price, stop_price, volatility, signal_confidence,
+                   limits, remaining_capacity) -> tuple[int, float, float, float]:
         """
-        Calculate optimal position size using modified Kelly Criterion.
-
-        The Kelly formula: f* = (bp - q) / b
-        Where:
-            b = odds ratio (reward/risk)
-            p = probability of winning
-            q = 1 - p
-
-        We use HALF-Kelly for safety, then apply volatility scaling.
+        Half-Kelly sizing for one proposal in plain floats (0-d NumPy arrays
+        would cost more than the math itself).
+        limits is (max_position_pct, max_single_asset_pct).
+        Returns (shares, half_kelly, vol_scalar, win_prob).
         """
-        can, reason = self.can_trade()
-        if not can:
-            return {"shares": 0, "notional": 0, "reason": reason}
-
-        # Risk per share
+        max_position_pct, max_single_asset_pct = limits
         risk_per_share = abs(entry_price - stop_price)
-        if risk_per_share == 0:
-            return {"shares": 0, "notional": 0, "reason": "Stop price equals entry"}
 
         # Estimate win probability from signal confidence
         # Signal confidence 0.7 → ~58% win rate (conservative mapping)
@@ -516,27 +917,56 @@ class RiskManager:
         vol_scalar = max(0.3, 1.0 - (volatility * 2))  # Vol 0.5 → scalar 0.3
 
         # Maximum dollar risk for this trade
-        max_risk_dollars = self.capital * self.limits.max_position_pct * half_kelly * vol_scalar
+        max_risk_dollars = capital * max_position_pct * half_kelly * vol_scalar
 
         # Calculate shares
         shares = int(max_risk_dollars / risk_per_share) if risk_per_share > 0 else 0
 
         # Apply absolute limits
-        max_notional = self.capital * self.limits.max_single_asset_pct
+        max_notional = capital * max_single_asset_pct
         max_shares_by_notional = int(max_notional / entry_price) if entry_price > 0 else 0
         shares = min(shares, max_shares_by_notional)
 
         # Check total exposure
-        current_exposure = sum(p.get("notional", 0) for p in self.positions.values())
-        remaining_capacity = (self.capital * self.limits.max_total_exposure_pct) - current_exposure
         if shares * entry_price > remaining_capacity:
             shares = max(0, int(remaining_capacity / entry_price))
 
-        notional = shares * entry_price
+        return shares, half_kelly, vol_scalar, win_prob
+
+    def calculate_position_size(self, asset: str, entry_price: float,
+                                stop_price: float, volatility: float,
+                                signal_confidence: float,
+                                ctx: Optional[TickContext] = None) -> dict:
+        """
+        Calculate optimal position size using modified Kelly Criterion.
+
+        The Kelly formula: f* = (bp - q) / b
+        Where:
+            b = odds ratio (reward/risk)
+            p = probability of winning
+            q = 1 - p
+
+        We use HALF-Kelly for safety, then apply volatility scaling.
+        """
+        can, reason = self.can_trade(ctx)
+        if not can:
+            return {"shares": 0, "notional": 0, "reason": reason}
+
+        # Risk per share
+        risk_per_share = abs(entry_price - stop_price)
+        if risk_per_share == 0:
+            return {"shares": 0, "notional": 0, "reason": "Stop price equals entry"}
+
+        remaining_capacity = self._max_exposure_cap - self._total_exposure
+
+        shares, half_kelly, vol_scalar, win_prob = self._size_math(
+            self.capital, entry_price, stop_price, volatility, signal_confidence,
+            (self.limits.max_position_pct, self.limits.max_single_asset_pct),
+            remaining_capacity)
 
         return {
             "shares": shares,
-            "notional": notional,
+            "notional": shares * entry_price,
             "risk_dollars": shares * risk_per_share,
             "kelly_fraction": half_kelly,
             "vol_scalar": vol_scalar,
@@ -544,26 +974,33 @@ class RiskManager:
             "reason": "OK" if shares > 0 else "Position too small after limits"
         }
 
-    def record_trade_result(self, pnl: float, asset: str):
-        """Record a completed trade and update tracking."""
+    def record_trade_result(self, pnl: float, asset: str, ctx: Optional[TickContext] = None,
+                            notional: Optional[float] = None):
+        """
+        Record a completed trade and update tracking. notional is the closed
+        order's sizing notional; omit it for results not tied to a tracked order.
+        """
+        ctx = ctx if ctx is not None else TickContext.capture()
         self.daily_pnl += pnl
         self.capital += pnl
+        self._max_exposure_cap = self.capital * self.limits.max_total_exposure_pct
         self.peak_capital = max(self.peak_capital, self.capital)
         self.daily_trade_count += 1
+        if notional is not None:
+            self._close_position(asset, notional)
 
         if pnl < 0:
             self.consecutive_losses += 1
             if self.consecutive_losses >= self.limits.max_consecutive_losses:
-                self.cooldown_until = datetime.now(timezone.utc) + timedelta(
-                    minutes=self.limits.cooldown_minutes
-                )
+                self.cooldown_until = ctx.now + timedelta(minutes=self.limits.cooldown_minutes)
+                self._cooldown_until_ts = self.cooldown_until.timestamp()
                 log.warning(f"COOLDOWN ACTIVATED: {self.consecutive_losses} consecutive losses. "
                             f"Paused until {self.cooldown_until}")
         else:
             self.consecutive_losses = 0
 
         self.trade_log.append({
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": ctx.now.isoformat(),
             "asset": asset,
             "pnl": pnl,
             "capital_after": self.capital,
@@ -592,7 +1029,16 @@ class RiskManager:
 #  Orchestrator + Risk Manager decide.
 # ═════════════════════════════════════════════════════════════════════
 
-@dataclass
+@lru_cache(maxsize=None)
+def _regime_mask(regimes: frozenset) -> int:
+    """Bitmask with bit REGIME_CODE[r] set for each regime r (memoized per set)."""
+    mask = 0
+    for regime in regimes:
+        mask |= 1 << REGIME_CODE[regime]
+    return mask
+
+
+@dataclass(slots=True)
 class TradeProposal:
     """A proposed trade from a strategy module."""
     strategy_name: str
@@ -603,19 +1049,45 @@ class TradeProposal:
     stop_price: float
     target_price: float
     confidence: float            # 0-1
-    regime_required: list        # Which regimes this trade works in
-    rationale: str
+    regime_required: frozenset   # Which regimes this trade works in
+    rationale: str | Callable[[], str]  # Callable defers formatting until the trade is executed
     urgency: str = "normal"      # "immediate", "normal", "patient"
     asset_class: str = "equity"  # "equity", "crypto", "option"
     option_details: dict = field(default_factory=dict)  # For options trades
     metadata: dict = field(default_factory=dict)
+    strategy_idx: int = -1       # Orchestrator's index for the proposing strategy (-1 = untagged)
+    regime_mask: int = field(default=0, init=False, repr=False, compare=False)  # from regime_required
+
+    def __post_init__(self):
+        self.regime_mask = _regime_mask(frozenset(self.regime_required))
+
+    def rationale_text(self) -> str:
+        """The rationale string, formatted now if the strategy deferred it."""
+        return self.rationale() if callable(self.rationale) else self.rationale
 
 
 class StrategyModule:
     """Base class for all strategy modules."""
 
     name: str = "base"
-    active_regimes: list = []
+    active_regimes: frozenset = frozenset()
+    watch_assets: frozenset = frozenset()  # Symbols generate_proposals reads from market_data
+    _active_mask = (np.zeros(len(REGIME_ORDER), dtype=bool) if NUMPY_AVAILABLE
+                    else (False,) * len(REGIME_ORDER))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Activation lookup indexed by REGIME_CODE, rebuilt per subclass declaration
+        flags = [regime in cls.active_regimes for regime in REGIME_ORDER]
+        cls._active_mask = np.array(flags, dtype=bool) if NUMPY_AVAILABLE else tuple(flags)
+
+    @staticmethod
+    def activation_matrix(strategies):
+        """
+        (n_strategies, n_regimes) bool matrix (NumPy required);
+        matrix[:, REGIME_CODE[regime]] answers which strategies a regime activates.
+        """
+        return np.stack([s._active_mask for s in strategies])
 
     def __init__(self, signal_agg: SignalAggregator, risk_mgr: RiskManager):
         self.signals = signal_agg
@@ -630,10 +1102,19 @@ class StrategyModule:
 
     def should_activate(self, regime: RegimeState) -> bool:
         """Check if this strategy should be active in current regime."""
-        return regime.regime in self.active_regimes and regime.confidence > 0.4
+        return bool(self._active_mask[REGIME_CODE[regime.regime]]) and regime.confidence > MIN_REGIME_CONFIDENCE
+
+    def required_assets(self) -> frozenset:
+        """Symbols this strategy needs priced each cycle it is active."""
+        return self.watch_assets
 
-    def generate_proposals(self, market_data: dict) -> list[TradeProposal]:
-        """Generate trade proposals. Override in subclass."""
+    def generate_proposals(self, market_data: dict,
+                           now: Optional[datetime] = None) -> list[TradeProposal]:
+        """Generate trade proposals. Override in subclass.
+
+        now is the orchestrator's cycle timestamp; strategies that need the
+        clock use it rather than reading their own (defaults to UTC now).
+        """
         raise NotImplementedError
 
     def manage_positions(self, market_data: dict) -> list[dict]:
@@ -641,6 +1122,69 @@ class StrategyModule:
         return []
 
 
+# Shared keep-alive session for Binance public endpoints (created on first use)
+_http_session = None
+
+# Binance request weight budget: at most one call per 200ms across all threads
+BINANCE_MIN_INTERVAL = 0.2
+
+
+class _RateLimiter:
+    """Token bucket of size one, shared by threads; 429s push the next slot out."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def back_off(self, seconds: float):
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
+_binance_limiter = _RateLimiter(BINANCE_MIN_INTERVAL)
+
+
+def _binance_session():
+    """Pooled session so funding/OI polls reuse one TLS connection per host."""
+    global _http_session
+    if _http_session is None:
+        session = req.Session()
+        # 5xx retried with backoff here; 429 is left to _binance_get so the
+        # Retry-After window is honoured instead of hammering into an IP ban
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[500, 502, 503, 504],
+                      allowed_methods=["GET"], raise_on_status=False)
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                              max_retries=retry))
+        _http_session = session
+    return _http_session
+
+
+def _binance_get(path: str, params: dict):
+    """Rate-limited GET against the Binance futures API."""
+    _binance_limiter.acquire()
+    resp = _binance_session().get(f"https://fapi.binance.com{path}", params=params, timeout=5)
+    if resp.status_code == 429:
+        retry_after = float(resp.headers.get("Retry-After", 1))
+        _binance_limiter.back_off(retry_after)
+        log.warning(f"Binance rate limited, backing off {retry_after:.0f}s")
+    return resp
+
+
+def _loads(raw):
+    """Decode a JSON payload (bytes or str), with orjson when available."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
 class CryptoLiquidationHunter(StrategyModule):
     """
     STRATEGY 1: Crypto Liquidation Cascade Hunter
@@ -655,15 +1199,54 @@ class CryptoLiquidationHunter(StrategyModule):
     """
 
     name = "crypto_liquidation_hunter"
-    active_regimes = [
+    active_regimes: frozenset = frozenset({
         Regime.HIGH_VOL_EXPANSION, Regime.CRASH,
         Regime.TRENDING_DOWN, Regime.TRENDING_UP
-    ]
+    })
+    watch_assets: frozenset = frozenset({"BTC/USD", "ETH/USD"})
 
     def __init__(self, signal_agg, risk_mgr):
         super().__init__(signal_agg, risk_mgr)
-        self.funding_rate_history = deque(maxlen=100)
-        self.oi_history = deque(maxlen=100)
+        self.funding_rate_history = RingBuffer(100)
+        self.oi_history = RingBuffer(100)
+        # Funding rate is fetched here while OI is fetched on the caller's thread
+        self._fetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="binance-fetch")
+        # (funding_rate, monotonic receive time) from the mark-price stream
+        self._ws_funding: Optional[tuple] = None
+        self._ws_thread: Optional[threading.Thread] = None
+
+    def _start_stream(self):
+        """Start the mark-price stream consumer on its own thread (once)."""
+        if self._ws_thread is not None or not (BINANCE_WS_ENABLED and WEBSOCKETS_AVAILABLE):
+            return
+        self._ws_thread = threading.Thread(
+            target=asyncio.run, args=(self._ws_consumer(),),
+            daemon=True, name="binance-ws"
+        )
+        self._ws_thread.start()
+
+    async def _ws_consumer(self):
+        """Keep the latest streamed funding rate; reconnect with exponential backoff."""
+        backoff = 1.0
+        while True:
+            try:
+                async with websockets.connect(BINANCE_WS_URL, ping_interval=20) as ws:
+                    backoff = 1.0
+                    async for raw in ws:
+                        data = _loads(raw).get("data", {})
+                        if data.get("r"):
+                            self._ws_funding = (float(data["r"]), time.monotonic())
+            except Exception as e:
+                log.debug(f"Binance stream dropped: {e}")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+    def _streamed_funding_rate(self) -> Optional[float]:
+        """Latest streamed funding rate, or None if the stream is off or stale."""
+        latest = self._ws_funding
+        if latest is None or time.monotonic() - latest[1] > BINANCE_WS_MAX_AGE:
+            return None
+        return latest[0]
 
     def _fetch_funding_rate(self) -> Optional[float]:
         """Fetch BTC perpetual funding rate from public API."""
@@ -671,13 +1254,9 @@ class CryptoLiquidationHunter(StrategyModule):
             return None
         try:
             # Binance public endpoint (no auth needed)
-            resp = req.get(
-                "https://fapi.binance.com/fapi/v1/fundingRate",
-                params={"symbol": "BTCUSDT", "limit": 1},
-                timeout=5
-            )
+            resp = _binance_get("/fapi/v1/fundingRate", {"symbol": "BTCUSDT", "limit": 1})
             if resp.status_code == 200:
-                data = resp.json()
+                data = _loads(resp.content)
                 if data:
                     return float(data[0]["fundingRate"])
         except Exception as e:
@@ -689,24 +1268,28 @@ class CryptoLiquidationHunter(StrategyModule):
         if not REQUESTS_AVAILABLE:
             return None
         try:
-            resp = req.get(
-                "https://fapi.binance.com/fapi/v1/openInterest",
-                params={"symbol": "BTCUSDT"},
-                timeout=5
-            )
+            resp = _binance_get("/fapi/v1/openInterest", {"symbol": "BTCUSDT"})
             if resp.status_code == 200:
-                return float(resp.json()["openInterest"])
+                return float(_loads(resp.content)["openInterest"])
         except Exception as e:
             log.debug(f"OI fetch failed: {e}")
         return None
 
     def process_data(self):
         """Fetch external data and generate signals."""
-        funding = self._fetch_funding_rate()
-        oi = self._fetch_open_interest()
+        self._start_stream()
+        funding = self._streamed_funding_rate()
+        if funding is not None:
+            # Funding is already in memory; OI has no stream, so it stays on REST
+            oi = self._fetch_open_interest()
+        else:
+            # The two Binance calls are independent: overlap their round-trips
+            funding_future = self._fetch_pool.submit(self._fetch_funding_rate)
+            oi = self._fetch_open_interest()
+            funding = funding_future.result()
 
         if funding is not None:
-            self.funding_rate_history.append(funding)
+            self.funding_rate_history.push(funding)
 
             # SIGNAL: Extreme funding rate
             if abs(funding) > 0.0005:  # 0.05% per 8hr = extreme
@@ -723,11 +1306,12 @@ class CryptoLiquidationHunter(StrategyModule):
                 ))
 
         if oi is not None:
-            self.oi_history.append(oi)
+            self.oi_history.push(oi)
 
             # SIGNAL: OI rapid decline (liquidation cascade in progress)
             if len(self.oi_history) >= 2:
-                oi_change = (oi - self.oi_history[-2]) / self.oi_history[-2]
+                prev_oi = float(self.oi_history.tail(2)[0])
+                oi_change = (oi - prev_oi) / prev_oi
                 if oi_change < -0.05:  # >5% OI drop = major liquidation
                     self.signals.add_signal(Signal(
                         name="BTC OI Cascade Detected",
@@ -740,7 +1324,8 @@ class CryptoLiquidationHunter(StrategyModule):
                         metadata={"oi_change_pct": oi_change}
                     ))
 
-    def generate_proposals(self, market_data: dict) -> list[TradeProposal]:
+    def generate_proposals(self, market_data: dict,
+                           now: Optional[datetime] = None) -> list[TradeProposal]:
         """Generate crypto trade proposals based on liquidation mechanics."""
         proposals = []
         self.process_data()
@@ -772,8 +1357,9 @@ class CryptoLiquidationHunter(StrategyModule):
                 target_price=btc_price + target_distance,
                 confidence=confidence,
                 regime_required=self.active_regimes,
-                rationale=f"Liquidation hunter LONG: {btc_composite['dominant_signal']} "
-                          f"(composite={direction:+.2f}, signals={btc_composite['signal_count']})",
+                rationale=lambda bc=btc_composite, d=direction: (
+                    f"Liquidation hunter LONG: {bc['dominant_signal']} "
+                    f"(composite={d:+.2f}, signals={bc['signal_count']})"),
                 asset_class="crypto"
             ))
         elif direction < -0.2:  # Bearish
@@ -787,14 +1373,24 @@ class CryptoLiquidationHunter(StrategyModule):
                 target_price=btc_price - target_distance,
                 confidence=confidence,
                 regime_required=self.active_regimes,
-                rationale=f"Liquidation hunter SHORT: {btc_composite['dominant_signal']} "
-                          f"(composite={direction:+.2f}, signals={btc_composite['signal_count']})",
+                rationale=lambda bc=btc_composite, d=direction: (
+                    f"Liquidation hunter SHORT: {bc['dominant_signal']} "
+                    f"(composite={d:+.2f}, signals={bc['signal_count']})"),
                 asset_class="crypto"
             ))
 
         return proposals
 
 
+@dataclass(frozen=True, slots=True)
+class EventSpec:
+    """A scheduled macro release, built once and reused every cycle."""
+    name: str
+    impact: float
+    assets: tuple[str, ...]
+    time: datetime
+
+
 class EventDrivenMacro(StrategyModule):
     """
     STRATEGY 2: Macro Event Scalper
@@ -809,7 +1405,7 @@ class EventDrivenMacro(StrategyModule):
     """
 
     name = "event_driven_macro"
-    active_regimes = list(Regime)  # Active in all regimes
+    active_regimes: frozenset = frozenset(Regime)  # Active in all regimes
 
     # Major economic event calendar (would be dynamically fetched in production)
     EVENTS = {
@@ -822,54 +1418,57 @@ class EventDrivenMacro(StrategyModule):
         "PCE": {"impact": 0.8, "assets": ["SPY", "TLT", "GLD"]},
     }
 
-    def _check_upcoming_events(self) -> list[dict]:
+    def __init__(self, signal_agg, risk_mgr):
+        super().__init__(signal_agg, risk_mgr)
+        # CRITICAL UPCOMING EVENTS (as of Feb 8, 2026):
+        # Feb 11 - Delayed January NFP release (HUGE - market has been starved for this)
+        # Feb 13 - CPI January (pushed from Feb 12)
+        # In production: fetch from FRED calendar API
+        self._event_calendar: list[EventSpec] = [
+            self._event("NFP", datetime(2026, 2, 11, 13, 30, tzinfo=timezone.utc)),  # 8:30 AM ET
+            self._event("CPI", datetime(2026, 2, 13, 13, 30, tzinfo=timezone.utc)),
+        ]
+
+    @classmethod
+    def _event(cls, name: str, when: datetime) -> EventSpec:
+        spec = cls.EVENTS[name]
+        return EventSpec(name, spec["impact"], tuple(spec["assets"]), when)
+
+    def required_assets(self) -> frozenset:
+        """Every asset a calendar event can flag."""
+        return frozenset(asset for event in self._event_calendar for asset in event.assets)
+
+    def _check_upcoming_events(self, now: Optional[datetime] = None) -> list[tuple[EventSpec, float]]:
         """
         Check for upcoming macro events within next 24 hours.
         In production, this would scrape the BLS/Fed calendar or use
         an economic calendar API. Here we demonstrate the logic.
+
+        Returns (event, hours_away) pairs over the prebuilt calendar records.
         """
-        # CRITICAL UPCOMING EVENTS (as of Feb 8, 2026):
-        # Feb 11 - Delayed January NFP release (HUGE - market has been starved for this)
-        # Feb 13 - CPI January (pushed from Feb 12)
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         upcoming = []
-
-        # Example: Check if NFP is within 24 hours
-        # In production: fetch from FRED calendar API
-        nfp_date = datetime(2026, 2, 11, 13, 30, tzinfo=timezone.utc)  # 8:30 AM ET
-        if 0 < (nfp_date - now).total_seconds() < 86400:
-            upcoming.append({
-                "event": "NFP",
-                "time": nfp_date,
-                "hours_away": (nfp_date - now).total_seconds() / 3600,
-                **self.EVENTS["NFP"]
-            })
-
-        cpi_date = datetime(2026, 2, 13, 13, 30, tzinfo=timezone.utc)
-        if 0 < (cpi_date - now).total_seconds() < 86400:
-            upcoming.append({
-                "event": "CPI",
-                "time": cpi_date,
-                "hours_away": (cpi_date - now).total_seconds() / 3600,
-                **self.EVENTS["CPI"]
-            })
-
+        for event in self._event_calendar:
+            seconds_away = (event.time - now).total_seconds()
+            if 0 < seconds_away < 86400:
+                upcoming.append((event, seconds_away / 3600))
         return upcoming
 
-    def generate_proposals(self, market_data: dict) -> list[TradeProposal]:
+    def generate_proposals(self, market_data: dict,
+                           now: Optional[datetime] = None) -> list[TradeProposal]:
         """
         Pre-event: Buy straddle-equivalent (long both directions)
         Post-event: Trade the directional move after initial 15min candle
         """
         proposals = []
-        events = self._check_upcoming_events()
+        events = self._check_upcoming_events(now)
 
-        for event in events:
-            hours_away = event["hours_away"]
+        for event, hours_away in events:
 
             # PRE-EVENT SETUP (1-4 hours before)
             if 1 < hours_away < 4:
-                for asset in event["assets"]:
+                for asset in event.assets:
                     price = market_data.get(asset, 0)
                     if price <= 0:
                         continue
@@ -877,17 +1476,17 @@ class EventDrivenMacro(StrategyModule):
                     # Pre-event: we want LONG VOLATILITY
                     # For equities/ETFs without options: buy shares with tight stops
                     # The signal will tell us which direction after release
-                    impact = event["impact"]
+                    impact = event.impact
 
                     self.signals.add_signal(Signal(
-                        name=f"Pre-{event['event']} Vol Setup",
+                        name=f"Pre-{event.name} Vol Setup",
                         source="labor_data",
                         direction=0.0,  # Neutral direction, just flagging vol
                         strength=impact,
                         asset_class="equity" if asset != "BTC/USD" else "crypto",
                         target_assets=[asset],
                         ttl_minutes=int(hours_away * 60),
-                        metadata={"event": event["event"], "hours_away": hours_away}
+                        metadata={"event": event.name, "hours_away": hours_away}
                     ))
 
             # POST-EVENT DIRECTION TRADE (within 2 hours after)
@@ -911,14 +1510,19 @@ class MetalsFlowTrader(StrategyModule):
     """
 
     name = "metals_flow_trader"
-    active_regimes = [
+    active_regimes: frozenset = frozenset({
         Regime.HIGH_VOL_EXPANSION, Regime.CRASH,
         Regime.RECOVERY, Regime.MEAN_REVERTING
-    ]
+    })
+    watch_assets: frozenset = frozenset({"GLD", "SLV", "GDX"})
 
     def __init__(self, signal_agg, risk_mgr):
         super().__init__(signal_agg, risk_mgr)
-        self.gold_silver_ratio_history = deque(maxlen=100)
+        self.gold_silver_ratio_history = RingBuffer(100)
+        # Running mean / sum of squared deviations over the ratio window (Welford)
+        self._ratio_mean = 0.0
+        self._ratio_m2 = 0.0
+        self._ratio_updates = 0
 
     def _calc_gold_silver_ratio(self, gld_price: float, slv_price: float) -> float:
         """
@@ -930,7 +1534,37 @@ class MetalsFlowTrader(StrategyModule):
         # Approximate ratio: (GLD * 10) / SLV gives rough gold/silver
         return (gld_price * 10) / slv_price
 
-    def generate_proposals(self, market_data: dict) -> list[TradeProposal]:
+    def _push_ratio(self, ratio: float):
+        """Append a ratio and update the window mean/M2 in O(1)."""
+        history = self.gold_silver_ratio_history
+        evicted = history.oldest() if len(history) == history.capacity else None
+        history.push(ratio)
+        self._ratio_updates += 1
+        n = len(history)
+
+        if self._ratio_updates % RATIO_RESYNC_EVERY == 0:
+            # Re-reduce from the window so add/remove rounding never accumulates
+            window = history.tail(n)
+            if NUMPY_AVAILABLE:
+                self._ratio_mean, self._ratio_m2 = _window_mean_m2(window)
+            else:
+                self._ratio_mean = sum(window) / n
+                self._ratio_m2 = sum((r - self._ratio_mean) ** 2 for r in window)
+        elif evicted is None:
+            delta = ratio - self._ratio_mean
+            self._ratio_mean += delta / n
+            self._ratio_m2 += delta * (ratio - self._ratio_mean)
+        else:
+            old_mean = self._ratio_mean
+            self._ratio_mean += (ratio - evicted) / n
+            self._ratio_m2 += (ratio - evicted) * (ratio - self._ratio_mean + evicted - old_mean)
+
+        # Snap rounding residue to zero: a flat window must keep failing std > 0
+        if self._ratio_m2 < 1e-12 * n * self._ratio_mean ** 2:
+            self._ratio_m2 = 0.0
+
+    def generate_proposals(self, market_data: dict,
+                           now: Optional[datetime] = None) -> list[TradeProposal]:
         proposals = []
 
         gld = market_data.get("GLD", 0)
@@ -941,12 +1575,12 @@ class MetalsFlowTrader(StrategyModule):
 
         # GOLD/SILVER RATIO MEAN REVERSION
         ratio = self._calc_gold_silver_ratio(gld, slv)
-        self.gold_silver_ratio_history.append(ratio)
+        self._push_ratio(ratio)
 
-        if len(self.gold_silver_ratio_history) >= 20:
-            ratios = list(self.gold_silver_ratio_history)
-            mean_ratio = sum(ratios) / len(ratios)
-            std_ratio = (sum((r - mean_ratio)**2 for r in ratios) / len(ratios)) ** 0.5
+        n_ratios = len(self.gold_silver_ratio_history)
+        if n_ratios >= 20:
+            mean_ratio = self._ratio_mean
+            std_ratio = math.sqrt(self._ratio_m2 / n_ratios)
 
             if std_ratio > 0:
                 z_score = (ratio - mean_ratio) / std_ratio
@@ -974,8 +1608,9 @@ class MetalsFlowTrader(StrategyModule):
                         target_price=slv * 1.10,
                         confidence=min(0.8, abs(z_score) / 3.0),
                         regime_required=self.active_regimes,
-                        rationale=f"G/S ratio {ratio:.1f} is {z_score:.1f}σ above mean. "
-                                  f"Silver underpriced vs gold. Mean reversion trade.",
+                        rationale=lambda r=ratio, z=z_score: (
+                            f"G/S ratio {r:.1f} is {z:.1f}σ above mean. "
+                            f"Silver underpriced vs gold. Mean reversion trade."),
                         asset_class="equity"
                     ))
 
@@ -991,8 +1626,9 @@ class MetalsFlowTrader(StrategyModule):
                         target_price=gld * 1.06,
                         confidence=min(0.8, abs(z_score) / 3.0),
                         regime_required=self.active_regimes,
-                        rationale=f"G/S ratio {ratio:.1f} is {z_score:.1f}σ below mean. "
-                                  f"Gold underpriced vs silver. Mean reversion trade.",
+                        rationale=lambda r=ratio, z=z_score: (
+                            f"G/S ratio {r:.1f} is {z:.1f}σ below mean. "
+                            f"Gold underpriced vs silver. Mean reversion trade."),
                         asset_class="equity"
                     ))
 
@@ -1012,14 +1648,16 @@ class SaaSDisruptionTrader(StrategyModule):
     """
 
     name = "saas_disruption_trader"
-    active_regimes = [Regime.TRENDING_DOWN, Regime.HIGH_VOL_EXPANSION, Regime.RECOVERY]
+    active_regimes: frozenset = frozenset({Regime.TRENDING_DOWN, Regime.HIGH_VOL_EXPANSION, Regime.RECOVERY})
 
     # Categorize by vulnerability
     STRUCTURALLY_IMPAIRED = ["LZ"]      # Short these on AI launches
     TEMPORARILY_PUNISHED = ["CRM", "SHOP", "ADBE", "MSFT", "WDAY"]  # Buy dips
     SECTOR_ETF = ["IGV"]
+    watch_assets: frozenset = frozenset(SECTOR_ETF + STRUCTURALLY_IMPAIRED + TEMPORARILY_PUNISHED)
 
-    def generate_proposals(self, market_data: dict) -> list[TradeProposal]:
+    def generate_proposals(self, market_data: dict,
+                           now: Optional[datetime] = None) -> list[TradeProposal]:
         proposals = []
 
         igv_price = market_data.get("IGV", 0)
@@ -1044,8 +1682,9 @@ class SaaSDisruptionTrader(StrategyModule):
                         target_price=price * 0.85,
                         confidence=igv_composite["confidence"],
                         regime_required=self.active_regimes,
-                        rationale=f"SaaS disruption SHORT: {asset} structurally impaired. "
-                                  f"IGV composite={igv_composite['direction']:+.2f}",
+                        rationale=lambda a=asset, d=igv_composite["direction"]: (
+                            f"SaaS disruption SHORT: {a} structurally impaired. "
+                            f"IGV composite={d:+.2f}"),
                         asset_class="equity"
                     ))
 
@@ -1063,9 +1702,10 @@ class SaaSDisruptionTrader(StrategyModule):
                         stop_price=price * 0.93,
                         target_price=price * 1.12,
                         confidence=igv_composite["confidence"] * 0.8,
-                        regime_required=[Regime.RECOVERY, Regime.MEAN_REVERTING],
-                        rationale=f"SaaS recovery LONG: {asset} quality name oversold. "
-                                  f"DeepSeek playbook - panic reverses.",
+                        regime_required=frozenset({Regime.RECOVERY, Regime.MEAN_REVERTING}),
+                        rationale=lambda a=asset: (
+                            f"SaaS recovery LONG: {a} quality name oversold. "
+                            f"DeepSeek playbook - panic reverses."),
                         asset_class="equity"
                     ))
 
@@ -1085,9 +1725,11 @@ class CrossAssetRegimeTrader(StrategyModule):
     """
 
     name = "cross_asset_regime"
-    active_regimes = list(Regime)
+    active_regimes: frozenset = frozenset(Regime)
+    watch_assets: frozenset = frozenset({"SPY", "TLT", "GLD", "BTC/USD", "HYG"})
 
-    def generate_proposals(self, market_data: dict) -> list[TradeProposal]:
+    def generate_proposals(self, market_data: dict,
+                           now: Optional[datetime] = None) -> list[TradeProposal]:
         """
         This strategy primarily generates SIGNALS, not direct trades.
         It monitors cross-asset relationships and feeds the signal aggregator.
@@ -1127,7 +1769,7 @@ class CrossAssetRegimeTrader(StrategyModule):
                     stop_price=tlt * 0.97,
                     target_price=tlt * 1.05,
                     confidence=tlt_composite["confidence"],
-                    regime_required=[Regime.TRENDING_DOWN, Regime.CRASH, Regime.HIGH_VOL_EXPANSION],
+                    regime_required=frozenset({Regime.TRENDING_DOWN, Regime.CRASH, Regime.HIGH_VOL_EXPANSION}),
                     rationale="Cross-asset: Risk-off regime detected. Bonds rallying.",
                     asset_class="equity"
                 )]
@@ -1142,17 +1784,26 @@ class CrossAssetRegimeTrader(StrategyModule):
 #  Handles order types, bracket orders, and position management.
 # ═════════════════════════════════════════════════════════════════════
 
+# Symbols routed to Alpaca's crypto endpoints (quotes, notional GTC orders)
+CRYPTO_SYMBOLS = frozenset({"BTC/USD", "ETH/USD"})
+
+
 class AlpacaExecutor:
     """
     Handles all interaction with Alpaca's Trading API.
     Paper trading mode by default.
     """
 
-    def __init__(self, api_key: str, secret_key: str, paper: bool = True):
+    def __init__(self, api_key: str, secret_key: str, paper: bool = True,
+                 ttl_seconds: float = 0.5):
         self.paper = paper
         self.client = None
         self.stock_data = None
         self.crypto_data = None
+        # symbol -> (monotonic fetch time, price); shared with the price-fetch pool
+        self.ttl_seconds = ttl_seconds
+        self._price_cache: dict[str, tuple[float, float]] = {}
+        self._price_lock = threading.Lock()
 
         if ALPACA_AVAILABLE and api_key and secret_key:
             try:
@@ -1185,13 +1836,37 @@ class AlpacaExecutor:
             log.error(f"Account info error: {e}")
             return {}
 
+    def _cached_price(self, symbol: str) -> Optional[float]:
+        with self._price_lock:
+            entry = self._price_cache.get(symbol)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+            return entry[1]
+        return None
+
+    def _cache_prices(self, prices: dict[str, float]):
+        now = time.monotonic()
+        with self._price_lock:
+            for symbol, price in prices.items():
+                self._price_cache[symbol] = (now, price)
+
     def get_current_price(self, symbol: str) -> float:
-        """Get latest price for a symbol."""
+        """Get latest price for a symbol (served from cache within ttl_seconds)."""
         if not self.client:
             return 0.0
 
+        cached = self._cached_price(symbol)
+        if cached is not None:
+            return cached
+
+        price = self._fetch_price(symbol)
+        if price > 0:
+            self._cache_prices({symbol: price})
+        return price
+
+    def _fetch_price(self, symbol: str) -> float:
+        """Latest ask price for one symbol straight from Alpaca."""
         try:
-            if "/" in symbol:  # Crypto
+            if symbol in CRYPTO_SYMBOLS:
                 if self.crypto_data:
                     request = CryptoLatestQuoteRequest(symbol_or_symbols=[symbol])
                     quotes = self.crypto_data.get_crypto_latest_quote(request)
@@ -1207,6 +1882,44 @@ class AlpacaExecutor:
             log.debug(f"Price fetch error for {symbol}: {e}")
         return 0.0
 
+    def get_current_prices(self, equities: list[str], cryptos: list[str]) -> dict[str, float]:
+        """
+        Latest ask prices with one quote request per asset class. Symbols
+        missing from the response (or quoted at 0) are omitted.
+        """
+        prices = {}
+        if not self.client:
+            return prices
+
+        if equities and self.stock_data:
+            try:
+                request = StockLatestQuoteRequest(symbol_or_symbols=equities)
+                quotes = self.stock_data.get_stock_latest_quote(request)
+                prices.update(self._ask_prices(quotes))
+            except Exception as e:
+                log.debug(f"Batch stock quote error: {e}")
+
+        if cryptos and self.crypto_data:
+            try:
+                request = CryptoLatestQuoteRequest(symbol_or_symbols=cryptos)
+                quotes = self.crypto_data.get_crypto_latest_quote(request)
+                prices.update(self._ask_prices(quotes))
+            except Exception as e:
+                log.debug(f"Batch crypto quote error: {e}")
+
+        self._cache_prices(prices)
+        return prices
+
+    @staticmethod
+    def _ask_prices(quotes: dict) -> dict[str, float]:
+        """Positive ask prices from a symbol -> quote mapping."""
+        asks = {}
+        for symbol, quote in quotes.items():
+            ask = float(quote.ask_price)
+            if ask > 0:
+                asks[symbol] = ask
+        return asks
+
     def execute_proposal(self, proposal: TradeProposal, shares: int) -> Optional[str]:
         """
         Execute a trade proposal via Alpaca API.
@@ -1223,15 +1936,16 @@ class AlpacaExecutor:
             return f"SIM-{int(time.time())}"
 
         try:
+            is_crypto = proposal.asset in CRYPTO_SYMBOLS
             side = OrderSide.BUY if proposal.side == "buy" else OrderSide.SELL
 
             if proposal.order_type == "market":
                 order_req = MarketOrderRequest(
                     symbol=proposal.asset,
-                    qty=shares if "/" not in proposal.asset else None,
-                    notional=shares * proposal.entry_price if "/" in proposal.asset else None,
+                    qty=None if is_crypto else shares,
+                    notional=shares * proposal.entry_price if is_crypto else None,
                     side=side,
-                    time_in_force=TimeInForce.GTC if "/" in proposal.asset else TimeInForce.DAY
+                    time_in_force=TimeInForce.GTC if is_crypto else TimeInForce.DAY
                 )
             elif proposal.order_type == "limit":
                 order_req = LimitOrderRequest(
@@ -1291,6 +2005,54 @@ class AlpacaExecutor:
 #  7. Adapts dynamically as regime shifts
 # ═════════════════════════════════════════════════════════════════════
 
+class _PositionBook:
+    """
+    Open orders mirrored as parallel arrays (SoA) in _open_orders order, so
+    the per-cycle stop/target/trailing checks are a few masked array ops
+    instead of a branch chain per position.
+    """
+
+    COLUMNS = {"entry": "float64", "stop": "float64", "target": "float64",
+               "shares": "float64", "is_long": "bool", "asset_idx": "intp"}
+
+    def __init__(self, capacity: int = 16):
+        self.order_ids: list[str] = []
+        for column, dtype in self.COLUMNS.items():
+            setattr(self, column, np.empty(capacity, dtype=dtype))
+
+    def __len__(self) -> int:
+        return len(self.order_ids)
+
+    def add(self, order_id: str, proposal: TradeProposal, shares: float, asset_idx: int):
+        if order_id in self.order_ids:
+            # Same id again: overwrite in place, as the _open_orders dict does
+            n = self.order_ids.index(order_id)
+        else:
+            n = len(self.order_ids)
+            if n == len(self.entry):
+                for column, dtype in self.COLUMNS.items():
+                    grown = np.empty(2 * n, dtype=dtype)
+                    grown[:n] = getattr(self, column)
+                    setattr(self, column, grown)
+            self.order_ids.append(order_id)
+        self.entry[n] = proposal.entry_price
+        self.stop[n] = proposal.stop_price
+        self.target[n] = proposal.target_price
+        self.shares[n] = shares
+        self.is_long[n] = proposal.side == "buy"
+        self.asset_idx[n] = asset_idx
+
+    def remove(self, drop):
+        """Drop the rows set in a boolean mask, keeping order."""
+        n = len(self.order_ids)
+        keep = ~drop
+        kept = int(keep.sum())
+        for column in self.COLUMNS:
+            values = getattr(self, column)
+            values[:kept] = values[:n][keep]
+        self.order_ids = [order_id for order_id, k in zip(self.order_ids, keep) if k]
+
+
 class HydraOrchestrator:
     """
     The master controller of the HYDRA system.
@@ -1310,6 +2072,15 @@ class HydraOrchestrator:
     8. LEARN    → Log results, update strategy weights
     """
 
+    # Watched assets, split by asset class once rather than per request
+    _ASSETS_EQ = [
+        "SPY", "QQQ", "TLT", "GLD", "SLV", "IGV",
+        "CRM", "SHOP", "ADBE", "MSFT", "WDAY", "LZ",
+        "HYG", "XLF", "XLE", "GDX", "UVXY",
+    ]
+    _ASSETS_CR = ["BTC/USD", "ETH/USD"]
+    ASSETS = _ASSETS_EQ + _ASSETS_CR
+
     def __init__(self):
         log.info("=" * 70)
         log.info("  HYDRA ENGINE INITIALIZING")
@@ -1320,6 +2091,14 @@ class HydraOrchestrator:
         self.risk_mgr = RiskManager(starting_capital=100000.0)
         self.regime_detector = RegimeDetector()
         self.executor = AlpacaExecutor(API_KEY, API_SECRET, paper=PAPER)
+        # Per-symbol quote fallback runs here so the cycle waits ~1 RTT, not N
+        self._price_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="price-fetch")
+        # Latest prices as a dense vector (0 = no quote this cycle) for vectorized consumers
+        self.symbol_index = {symbol: i for i, symbol in enumerate(self.ASSETS)}
+        self.price_vec = np.zeros(len(self.ASSETS)) if NUMPY_AVAILABLE else [0.0] * len(self.ASSETS)
+        # Latest streamed ask per symbol as (price, monotonic time), written by the run loop
+        self._stream_prices: dict[str, tuple[float, float]] = {}
+        self.md_queue: Optional[asyncio.Queue] = None
 
         # Strategy modules
         self.strategies: list[StrategyModule] = [
@@ -1332,40 +2111,157 @@ class HydraOrchestrator:
 
         # Tracking
         self.cycle_count = 0
-        self.active_orders = {}
+        self._open_orders: dict[str, dict] = {}       # order_id -> order info, open only
+        self._closed_orders: deque = deque(maxlen=1000)  # recent stopped-out / target-hit orders
+        self._positions = _PositionBook() if NUMPY_AVAILABLE else None  # _open_orders as arrays
         self.running = False
 
+        self._build_regime_tables()
+
         # Dynamic strategy weights (updated based on recent performance)
         self.strategy_weights = {s.name: 1.0 for s in self.strategies}
+        # Same weights by strategy index, for array lookups when ranking
+        self._strat_idx = {s.name: i for i, s in enumerate(self.strategies)}
+        self._weight_vec = np.ones(len(self.strategies)) if NUMPY_AVAILABLE else None
 
         log.info(f"Strategies loaded: {[s.name for s in self.strategies]}")
         log.info(f"Executor mode: {'Alpaca Paper' if self.executor.client else 'Dry-Run Simulation'}")
 
+    def _build_regime_tables(self):
+        """Precompute which strategies run, and which assets they read, in each regime."""
+        # Strategies dispatched per regime, as (strategy index, strategy)
+        self.strategies_by_regime: dict[Regime, list[tuple[int, StrategyModule]]] = {
+            r: [(i, s) for i, s in enumerate(self.strategies) if r in s.active_regimes]
+            for r in Regime
+        }
+        # Per-regime fetch lists: SPY (regime input) plus what those strategies
+        # read, split by asset class in ASSETS order
+        self._regime_assets: dict[Regime, tuple[list[str], list[str]]] = {}
+        for r, active in self.strategies_by_regime.items():
+            needed = {"SPY"}.union(*(s.required_assets() for _, s in active))
+            self._regime_assets[r] = ([a for a in self._ASSETS_EQ if a in needed],
+                                      [a for a in self._ASSETS_CR if a in needed])
+
+    def _watched_assets(self) -> tuple[list[str], list[str]]:
+        """
+        (equities, cryptos) to price this cycle: what the strategies active in
+        the last detected regime read, plus open positions. Everything until a
+        regime has been detected.
+        """
+        if not self.regime_detector.regime_history:
+            return self._ASSETS_EQ, self._ASSETS_CR
+        equities, cryptos = self._regime_assets[self.regime_detector.current_state.regime]
+        held = {order["proposal"].asset for order in self._open_orders.values()}
+        if held.issubset(equities + cryptos):
+            return equities, cryptos
+        needed = held.union(equities, cryptos)
+        return ([a for a in self._ASSETS_EQ if a in needed],
+                [a for a in self._ASSETS_CR if a in needed])
+
     def _fetch_market_data(self) -> dict:
         """
-        Fetch current prices for all watched assets.
+        Fetch current prices for the assets the active strategies watch.
         This is the data ingestion layer.
         """
-        assets = [
-            "SPY", "QQQ", "TLT", "GLD", "SLV", "IGV",
-            "CRM", "SHOP", "ADBE", "MSFT", "WDAY", "LZ",
-            "HYG", "XLF", "XLE", "GDX", "UVXY",
-            "BTC/USD", "ETH/USD"
-        ]
+        equities, cryptos = self._watched_assets()
+        assets = equities + cryptos
+
+        # Fresh streamed quotes first; REST only for what the stream has not covered
+        data = self._streamed_prices(assets)
+        if len(data) < len(assets):
+            # One batched quote call per asset class instead of one per symbol
+            data.update(self.executor.get_current_prices(
+                [a for a in equities if a not in data], [a for a in cryptos if a not in data]
+            ))
 
-        data = {}
-        for asset in assets:
-            price = self.executor.get_current_price(asset)
-            if price > 0:
-                data[asset] = price
+        # Anything the batch did not price (batch error, symbol dropped from
+        # the response) falls back to per-symbol requests, overlapped
+        missing = [asset for asset in assets if asset not in data]
+        if missing and self.executor.client:
+            for asset, price in zip(missing, self._price_pool.map(self.executor.get_current_price, missing)):
+                if price > 0:
+                    data[asset] = price
+
+        # In place, so views held by vectorized consumers stay valid
+        self.price_vec[:] = [data.get(asset, 0.0) for asset in self.ASSETS]
 
         return data
 
+    def _streamed_prices(self, assets: list[str]) -> dict[str, float]:
+        """Streamed asks for assets quoted within ALPACA_STREAM_MAX_AGE."""
+        if not self._stream_prices:
+            return {}
+        cutoff = time.monotonic() - ALPACA_STREAM_MAX_AGE
+        prices = {}
+        for asset in assets:
+            quote = self._stream_prices.get(asset)
+            if quote is not None and quote[1] >= cutoff:
+                prices[asset] = quote[0]
+        return prices
+
+    def _apply_quotes(self, quotes: list[tuple[str, float]]):
+        now = time.monotonic()
+        for symbol, price in quotes:
+            self._stream_prices[symbol] = (price, now)
+
+    async def _md_task(self, url: str, symbols: list[str]):
+        """Push (symbol, ask) batches from an Alpaca quote stream onto md_queue; reconnect with backoff."""
+        backoff = 1.0
+        while True:
+            try:
+                async with websockets.connect(url, ping_interval=20) as ws:
+                    await ws.send(json.dumps({"action": "auth", "key": API_KEY, "secret": API_SECRET}))
+                    async for raw in ws:
+                        messages = _loads(raw)
+                        if any(m.get("T") == "error" for m in messages):
+                            raise ConnectionError(messages)
+                        if any(m.get("msg") == "authenticated" for m in messages):
+                            break
+                    await ws.send(json.dumps({"action": "subscribe", "quotes": symbols}))
+                    backoff = 1.0
+                    async for raw in ws:
+                        quotes = [(m["S"], float(m["ap"])) for m in _loads(raw)
+                                  if m.get("T") == "q" and m.get("ap")]
+                        if quotes:
+                            await self.md_queue.put(quotes)
+            except Exception as e:
+                log.debug(f"Alpaca quote stream {url} dropped: {e}")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+    def _start_market_streams(self) -> list[asyncio.Task]:
+        """Quote stream tasks for the watched equities and cryptos (none in dry-run)."""
+        if not (ALPACA_STREAM_ENABLED and WEBSOCKETS_AVAILABLE and self.executor.client):
+            return []
+        return [
+            asyncio.create_task(self._md_task(ALPACA_STOCK_STREAM_URL, self._ASSETS_EQ)),
+            asyncio.create_task(self._md_task(ALPACA_CRYPTO_STREAM_URL, self._ASSETS_CR)),
+        ]
+
     def _rank_proposals(self, proposals: list[TradeProposal]) -> list[TradeProposal]:
         """
         Rank proposals by expected value = confidence × (target - entry) / (entry - stop).
         Apply strategy weight multiplier.
         """
+        if NUMPY_AVAILABLE and proposals:
+            n = len(proposals)
+            entries = np.fromiter((p.entry_price for p in proposals), float, count=n)
+            stops = np.fromiter((p.stop_price for p in proposals), float, count=n)
+            targets = np.fromiter((p.target_price for p in proposals), float, count=n)
+            conf = np.fromiter((p.confidence for p in proposals), float, count=n)
+            idx = np.fromiter((p.strategy_idx for p in proposals), np.intp, count=n)
+            weights = np.where(idx >= 0, self._weight_vec[idx], 1.0)
+
+            reward = np.abs(targets - entries)
+            risk = np.abs(entries - stops)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rr_ratio = np.where(risk > 0, reward / risk, 0.0)
+            ev = conf * rr_ratio * weights
+
+            # Stable, so equal-EV proposals keep their submission order
+            order = np.argsort(-ev, kind="stable")
+            return [proposals[i] for i in order]
+
         scored = []
         for p in proposals:
             reward = abs(p.target_price - p.entry_price)
@@ -1382,7 +2278,8 @@ class HydraOrchestrator:
         return [p for _, p in scored]
 
     def _execute_top_proposals(self, proposals: list[TradeProposal],
-                               market_data: dict, regime: RegimeState):
+                               market_data: dict, regime: RegimeState,
+                               ctx: TickContext):
         """Execute the highest-ranked proposals that pass risk management."""
         executed = 0
         max_per_cycle = 3  # Don't overwhelm with too many orders at once
@@ -1392,13 +2289,13 @@ class HydraOrchestrator:
                 break
 
             # Check regime compatibility
-            if regime.regime not in proposal.regime_required:
+            if not (proposal.regime_mask >> REGIME_CODE[regime.regime]) & 1:
                 log.debug(f"Skipping {proposal.asset}: regime {regime.regime} "
                           f"not in {proposal.regime_required}")
                 continue
 
             # Check risk limits
-            can_trade, reason = self.risk_mgr.can_trade()
+            can_trade, reason = self.risk_mgr.can_trade(ctx)
             if not can_trade:
                 log.warning(f"Risk block: {reason}")
                 break
@@ -1412,7 +2309,8 @@ class HydraOrchestrator:
                 entry_price=proposal.entry_price,
                 stop_price=proposal.stop_price,
                 volatility=volatility,
-                signal_confidence=proposal.confidence
+                signal_confidence=proposal.confidence,
+                ctx=ctx
             )
 
             if sizing["shares"] <= 0:
@@ -1422,28 +2320,75 @@ class HydraOrchestrator:
             # EXECUTE
             order_id = self.executor.execute_proposal(proposal, sizing["shares"])
             if order_id:
-                self.active_orders[order_id] = {
+                self.risk_mgr._open_position(proposal.asset, sizing["notional"])
+                self._open_orders[order_id] = {
                     "proposal": proposal,
                     "sizing": sizing,
-                    "entry_time": datetime.now(timezone.utc),
+                    "entry_time": ctx.now,
                     "status": "open"
                 }
+                if NUMPY_AVAILABLE:
+                    self._positions.add(order_id, proposal, sizing["shares"],
+                                        self.symbol_index.get(proposal.asset, -1))
                 executed += 1
                 log.info(f"✓ EXECUTED: {proposal.strategy_name} → "
                          f"{proposal.side.upper()} {sizing['shares']} {proposal.asset} "
                          f"@ ${proposal.entry_price:.2f} | "
                          f"Risk=${sizing['risk_dollars']:.2f} | "
-                         f"Kelly={sizing['kelly_fraction']:.3f}")
+                         f"Kelly={sizing['kelly_fraction']:.3f} | "
+                         f"{proposal.rationale_text()}")
+
+    def _manage_open_positions_vectorized(self, book: _PositionBook, ctx: TickContext):
+        """Stop/target/trailing pass over the SoA position book, prices from price_vec."""
+        n = len(book)
+        entry, stop, target = book.entry[:n], book.stop[:n], book.target[:n]
+        is_long, idx = book.is_long[:n], book.asset_idx[:n]
+        current = np.where(idx >= 0, self.price_vec[idx], 0.0)
+
+        # Same precedence as the scalar checks: stop, then target, then trailing
+        live = current > 0
+        hit_stop = live & np.where(is_long, current <= stop, current >= stop)
+        hit_target = live & ~hit_stop & np.where(is_long, current >= target, current <= target)
+        trail = (live & ~hit_stop & ~hit_target & is_long
+                 & (current > entry + (target - entry) * 0.5))
+        pnl = np.where(is_long, current - entry, entry - current) * book.shares[:n]
+
+        # TRAILING STOP: If in profit by 50%+ of target, tighten stop to breakeven
+        np.maximum(stop, entry, out=stop, where=trail)
+        for i in np.flatnonzero(trail):
+            proposal = self._open_orders[book.order_ids[i]]["proposal"]
+            proposal.stop_price = float(stop[i])
+            log.debug(f"Trailing stop moved to breakeven for {proposal.asset}")
+
+        exits = hit_stop | hit_target
+        for i in np.flatnonzero(exits):
+            order_info = self._open_orders.pop(book.order_ids[i])
+            proposal = order_info["proposal"]
+            self.executor.close_position(proposal.asset)
+            self.risk_mgr.record_trade_result(float(pnl[i]), proposal.asset, ctx,
+                                              notional=order_info["sizing"]["notional"])
+            if hit_stop[i]:
+                order_info["status"] = "stopped_out"
+                log.warning(f"✗ STOP HIT: {proposal.asset} | PnL=${pnl[i]:+,.2f}")
+            else:
+                order_info["status"] = "target_hit"
+                log.info(f"★ TARGET HIT: {proposal.asset} | PnL=${pnl[i]:+,.2f}")
+            self._closed_orders.append(order_info)
+        if exits.any():
+            book.remove(exits)
 
-    def _manage_open_positions(self, market_data: dict):
+    def _manage_open_positions(self, market_data: dict, ctx: TickContext):
         """
         Monitor open positions and enforce stops/targets.
         This runs every cycle and is critical for risk management.
+        With NumPy, current prices come from price_vec (this cycle's fetch).
         """
-        for order_id, order_info in list(self.active_orders.items()):
-            if order_info["status"] != "open":
-                continue
+        if NUMPY_AVAILABLE and len(self._positions):
+            self._manage_open_positions_vectorized(self._positions, ctx)
+            return
 
+        closed = []
+        for order_id, order_info in self._open_orders.items():
             proposal = order_info["proposal"]
             current_price = market_data.get(proposal.asset, 0)
             if current_price <= 0:
@@ -1453,42 +2398,35 @@ class HydraOrchestrator:
             stop = proposal.stop_price
             target = proposal.target_price
             is_long = proposal.side == "buy"
+            if is_long:
+                hit_stop, hit_target = current_price <= stop, current_price >= target
+            else:
+                hit_stop, hit_target = current_price >= stop, current_price <= target
 
-            # CHECK STOP
-            if is_long and current_price <= stop:
-                pnl = (current_price - entry) * order_info["sizing"]["shares"]
-                self.executor.close_position(proposal.asset)
-                self.risk_mgr.record_trade_result(pnl, proposal.asset)
-                order_info["status"] = "stopped_out"
-                log.warning(f"✗ STOP HIT: {proposal.asset} | PnL=${pnl:+,.2f}")
-
-            elif not is_long and current_price >= stop:
-                pnl = (entry - current_price) * order_info["sizing"]["shares"]
-                self.executor.close_position(proposal.asset)
-                self.risk_mgr.record_trade_result(pnl, proposal.asset)
-                order_info["status"] = "stopped_out"
-                log.warning(f"✗ STOP HIT: {proposal.asset} | PnL=${pnl:+,.2f}")
-
-            # CHECK TARGET
-            elif is_long and current_price >= target:
-                pnl = (current_price - entry) * order_info["sizing"]["shares"]
-                self.executor.close_position(proposal.asset)
-                self.risk_mgr.record_trade_result(pnl, proposal.asset)
-                order_info["status"] = "target_hit"
-                log.info(f"★ TARGET HIT: {proposal.asset} | PnL=${pnl:+,.2f}")
-
-            elif not is_long and current_price <= target:
-                pnl = (entry - current_price) * order_info["sizing"]["shares"]
+            # CHECK STOP, then TARGET
+            if hit_stop or hit_target:
+                move = current_price - entry if is_long else entry - current_price
+                pnl = move * order_info["sizing"]["shares"]
                 self.executor.close_position(proposal.asset)
-                self.risk_mgr.record_trade_result(pnl, proposal.asset)
-                order_info["status"] = "target_hit"
-                log.info(f"★ TARGET HIT: {proposal.asset} | PnL=${pnl:+,.2f}")
+                self.risk_mgr.record_trade_result(pnl, proposal.asset, ctx,
+                                                  notional=order_info["sizing"]["notional"])
+                if hit_stop:
+                    order_info["status"] = "stopped_out"
+                    log.warning(f"✗ STOP HIT: {proposal.asset} | PnL=${pnl:+,.2f}")
+                else:
+                    order_info["status"] = "target_hit"
+                    log.info(f"★ TARGET HIT: {proposal.asset} | PnL=${pnl:+,.2f}")
+                closed.append(order_id)
 
             # TRAILING STOP: If in profit by 50%+ of target, tighten stop to breakeven
             elif is_long and current_price > entry + (target - entry) * 0.5:
                 proposal.stop_price = max(stop, entry)  # Move stop to breakeven
                 log.debug(f"Trailing stop moved to breakeven for {proposal.asset}")
 
+        # Retire after the loop; the dict cannot change size while iterated
+        for order_id in closed:
+            self._closed_orders.append(self._open_orders.pop(order_id))
+
     def _update_strategy_weights(self):
         """
         Adapt strategy weights based on recent performance.
@@ -1505,7 +2443,10 @@ class HydraOrchestrator:
             # Weight = smoothed win rate × average R:R
             # With floor of 0.3 (never fully disable a strategy)
             wr = strategy.win_rate
-            self.strategy_weights[strategy.name] = max(0.3, min(2.0, wr * 2))
+            weight = max(0.3, min(2.0, wr * 2))
+            self.strategy_weights[strategy.name] = weight
+            if NUMPY_AVAILABLE:
+                self._weight_vec[self._strat_idx[strategy.name]] = weight
 
     def run_cycle(self):
         """
@@ -1513,6 +2454,7 @@ class HydraOrchestrator:
         This is called repeatedly (every 30-60 seconds during market hours).
         """
         self.cycle_count += 1
+        ctx = TickContext.capture()
 
         # ── STEP 1: OBSERVE ──
         market_data = self._fetch_market_data()
@@ -1525,7 +2467,7 @@ class HydraOrchestrator:
         vix_approx = 20.0  # Current VIX is around 20 based on research
 
         # ── STEP 2: DETECT REGIME ──
-        regime = self.regime_detector.update(spy_price, vix_approx)
+        regime = self.regime_detector.update(spy_price, vix_approx, ctx=ctx)
 
         if self.cycle_count % 10 == 0:  # Log regime every 10 cycles
             log.info(f"Regime: {regime.regime.value} (confidence={regime.confidence:.2f}) | "
@@ -1533,32 +2475,55 @@ class HydraOrchestrator:
                      f"MR={regime.mean_reversion_score:.2f}")
 
         # ── STEP 3: COLLECT PROPOSALS ──
-        all_proposals = []
-        for strategy in self.strategies:
-            if strategy.should_activate(regime):
-                try:
-                    proposals = strategy.generate_proposals(market_data)
-                    all_proposals.extend(proposals)
-                except Exception as e:
-                    log.error(f"Strategy {strategy.name} error: {e}")
+        all_proposals = self._collect_proposals(regime, market_data, ctx)
 
         # ── STEP 4: RANK & FILTER ──
         ranked = self._rank_proposals(all_proposals)
 
         # ── STEP 5: EXECUTE ──
         if ranked:
-            self._execute_top_proposals(ranked, market_data, regime)
+            self._execute_top_proposals(ranked, market_data, regime, ctx)
 
         # ── STEP 6: MANAGE POSITIONS ──
-        self._manage_open_positions(market_data)
+        self._manage_open_positions(market_data, ctx)
 
         # ── STEP 7: ADAPT ──
         if self.cycle_count % 50 == 0:
             self._update_strategy_weights()
 
-    def run(self, interval_seconds: int = 60):
+    def _collect_proposals(self, regime: RegimeState, market_data: dict,
+                           ctx: TickContext) -> list[TradeProposal]:
+        """Proposals from the strategies active in this regime; the others are not called at all."""
+        all_proposals = []
+        active = (self.strategies_by_regime[regime.regime]
+                  if regime.confidence > MIN_REGIME_CONFIDENCE else ())
+        for strategy_idx, strategy in active:
+            try:
+                proposals = strategy.generate_proposals(market_data, now=ctx.now)
+                for proposal in proposals:
+                    proposal.strategy_idx = strategy_idx
+                all_proposals.extend(proposals)
+            except Exception as e:
+                log.error(f"Strategy {strategy.name} error: {e}")
+        return all_proposals
+
+    async def _wait_for_quotes(self, timeout: float) -> bool:
+        """Apply streamed quotes, waiting up to timeout for the first; True if any arrived."""
+        try:
+            self._apply_quotes(await asyncio.wait_for(self.md_queue.get(), timeout))
+            arrived = True
+        except asyncio.TimeoutError:
+            arrived = False
+        while not self.md_queue.empty():
+            self._apply_quotes(self.md_queue.get_nowait())
+        return arrived
+
+    async def run(self, interval_seconds: int = 60):
         """
-        Main loop. Runs continuously, executing cycles at the given interval.
+        Main loop. A cycle runs every interval_seconds; streamed quotes in
+        between refresh prices. Setting HYDRA_MIN_CYCLE_SECONDS below the
+        interval lets quotes trigger cycles that often, which shortens every
+        bar-counted window in wall-clock terms.
         """
         self.running = True
         log.info("=" * 70)
@@ -1568,17 +2533,38 @@ class HydraOrchestrator:
         log.info(f"  Starting capital: ${self.risk_mgr.capital:,.2f}")
         log.info("=" * 70)
 
-        while self.running:
-            try:
-                self.run_cycle()
-                time.sleep(interval_seconds)
-            except KeyboardInterrupt:
-                log.info("Shutdown requested. Closing all positions...")
-                self.running = False
-                self._shutdown()
-            except Exception as e:
-                log.error(f"Cycle error: {e}")
-                time.sleep(interval_seconds)
+        loop = asyncio.get_running_loop()
+        min_cycle = MIN_CYCLE_SECONDS if MIN_CYCLE_SECONDS is not None else interval_seconds
+        self.md_queue = asyncio.Queue()
+        streams = self._start_market_streams()
+        last_cycle = loop.time() - interval_seconds  # first cycle runs immediately
+        cycle: Optional[asyncio.Future] = None
+        try:
+            while self.running:
+                timeout = max(0.0, last_cycle + interval_seconds - loop.time())
+                if (await self._wait_for_quotes(timeout)
+                        and loop.time() - last_cycle < min_cycle):
+                    continue
+
+                last_cycle = loop.time()
+                try:
+                    # Broker calls block, so the cycle runs off the loop and streams keep flowing.
+                    # Shielded: cancelling run must not orphan a cycle that is still trading.
+                    cycle = asyncio.ensure_future(asyncio.to_thread(self.run_cycle))
+                    await asyncio.shield(cycle)
+                except Exception as e:
+                    log.error(f"Cycle error: {e}")
+        except asyncio.CancelledError:
+            log.info("Shutdown requested. Closing all positions...")
+            self.running = False
+            if cycle is not None and not cycle.done():
+                # Let the in-flight cycle finish so no order lands after the close-out
+                await asyncio.wait({cycle})
+            self._shutdown()
+            raise
+        finally:
+            for task in streams:
+                task.cancel()
 
     def _shutdown(self):
         """Graceful shutdown — close all positions and log final state."""
@@ -1640,4 +2626,7 @@ if __name__ == "__main__":
     """)
 
     hydra = HydraOrchestrator()
-    hydra.run(interval_seconds=60)
+    try:
+        asyncio.run(hydra.run(interval_seconds=60))
+    except KeyboardInterrupt:
+        pass
@@ -26,7 +26,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 
 from hydra_signal_detection import SignalOrchestrator, export_dashboard_data, DATA_SOURCE_REGISTRY
 from hydra_telegram import TelegramBridge, SignalParser, EventScheduler
@@ -507,7 +507,7 @@ def get_predator_intelligence():
 
 
 @app.get("/api/gex")
-def get_gex():
+async def get_gex():
     """
     Layer 8: GEX (Gamma Exposure) regime and key levels.
 
@@ -519,9 +519,9 @@ def get_gex():
 
         if not snapshot:
             # Calculate fresh if no cached data
-            snapshot = gex_engine.calculate()
+            snapshot = await gex_engine.calculate_async()
 
-        return snapshot.to_dict()
+        return Response(snapshot.to_json(), media_type="application/json")
     except Exception as e:
         log.error(f"GEX endpoint error: {e}")
         return {
@@ -546,7 +546,7 @@ def get_flow():
         if not snapshot:
             snapshot = flow_decoder.calculate("SPY")
 
-        return snapshot.to_dict()
+        return Response(snapshot.to_json(), media_type="application/json")
     except Exception as e:
         log.error(f"Flow endpoint error: {e}")
         return {
@@ -0,0 +1,50 @@
+"""Exposure tracking when several orders are open on the same asset."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from hydra_engine import HydraOrchestrator, Regime, RiskManager, TickContext, TradeProposal
+
+
+def test_same_asset_orders_add_and_close_independently():
+    risk = RiskManager(starting_capital=100000.0)
+    risk._open_position("SLV", 4980.0)
+    risk._open_position("SLV", 4980.0)
+    assert risk._total_exposure == pytest.approx(9960.0)
+    assert risk.positions["SLV"]["notional"] == pytest.approx(9960.0)
+
+    risk.record_trade_result(-50.0, "SLV", notional=4980.0)
+    assert risk._total_exposure == pytest.approx(4980.0)
+    assert risk.positions["SLV"]["notional"] == pytest.approx(4980.0)
+
+    risk.record_trade_result(120.0, "SLV", notional=4980.0)
+    assert risk._total_exposure == 0.0
+    assert "SLV" not in risk.positions
+
+
+def test_stop_on_one_order_keeps_the_other_orders_exposure():
+    hydra = HydraOrchestrator()
+    order_ids = iter(["A", "B"])
+    hydra.executor.execute_proposal = lambda proposal, shares: next(order_ids)
+    hydra.executor.close_position = lambda symbol: True
+    ctx = TickContext.capture()
+
+    proposals = [
+        TradeProposal("metals_flow_trader", "SLV", "buy", "limit", 25.0, stop, 30.0,
+                      0.7, frozenset(Regime), "test")
+        for stop in (20.0, 10.0)
+    ]
+    hydra._execute_top_proposals(proposals, {"SLV": 25.0}, hydra.regime_detector.current_state, ctx)
+    opened = sum(order["sizing"]["notional"] for order in hydra._open_orders.values())
+    assert len(hydra._open_orders) == 2
+    assert hydra.risk_mgr._total_exposure == pytest.approx(opened)
+
+    # 15 is through order A's stop but above order B's
+    hydra.price_vec[hydra.symbol_index["SLV"]] = 15.0
+    hydra._manage_open_positions({"SLV": 15.0}, ctx)
+    assert list(hydra._open_orders) == ["B"]
+    assert hydra.risk_mgr._total_exposure == pytest.approx(hydra._open_orders["B"]["sizing"]["notional"])